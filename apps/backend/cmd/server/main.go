@@ -249,7 +249,12 @@ func main() {
 	// ✅ Action verification for SDK (signature-based auth, NO API key required)
 	// IMPORTANT: Register directly on app (not through group) to avoid API key middleware
 	// These endpoints verify Ed25519 signatures instead of requiring API keys
-	app.Post("/api/v1/sdk-api/verifications", middleware.RateLimitMiddleware(), h.Verification.CreateVerification)
+	// Single, bulk and scenario verifications share one budget of 100 checks per minute;
+	// bulk handlers charge every check, not just the request
+	verificationLimiter := middleware.NewCountingRateLimiter(100, 1*time.Minute)
+	app.Post("/api/v1/sdk-api/verifications", verificationLimiter.Handler(), h.Verification.CreateVerification)
+	app.Post("/api/v1/sdk-api/verifications/bulk", verificationLimiter.Handler(), h.Verification.CreateVerificationBulk)
+	app.Post("/api/v1/sdk-api/verifications/scenario", verificationLimiter.Handler(), h.Verification.RunScenario)
 	app.Get("/api/v1/sdk-api/verifications/:id", middleware.RateLimitMiddleware(), h.Verification.GetVerification)
 	app.Post("/api/v1/sdk-api/verifications/:id/result", middleware.RateLimitMiddleware(), h.Verification.SubmitVerificationResult)
 
@@ -16,6 +16,7 @@ import (
 	"github.com/google/uuid"
 	"github.com/opena2a/identity/backend/internal/application"
 	"github.com/opena2a/identity/backend/internal/domain"
+	"github.com/opena2a/identity/backend/internal/interfaces/http/middleware"
 )
 
 // VerificationHandler handles agent action verification requests
@@ -87,50 +88,52 @@ func (h *VerificationHandler) CreateVerification(c fiber.Ctx) error {
 		})
 	}
 
+	response, statusCode, errMsg := h.processVerification(c, req)
+	if errMsg != "" {
+		return c.Status(statusCode).JSON(fiber.Map{
+			"error": errMsg,
+		})
+	}
+
+	return c.Status(statusCode).JSON(response)
+}
+
+// processVerification verifies a single signed action request and records its
+// audit log, alerts and verification event. It returns the response, the HTTP
+// status code, and a non-empty error message if the request was rejected.
+func (h *VerificationHandler) processVerification(c fiber.Ctx, req VerificationRequest) (*VerificationResponse, int, string) {
 	// Validate required fields
 	if req.AgentID == "" || req.ActionType == "" || req.Signature == "" || req.PublicKey == "" {
-		return c.Status(fiber.StatusBadRequest).JSON(fiber.Map{
-			"error": "agent_id, action_type, signature, and public_key are required",
-		})
+		return nil, fiber.StatusBadRequest, "agent_id, action_type, signature, and public_key are required"
 	}
 
 	// Parse agent ID
 	agentID, err := uuid.Parse(req.AgentID)
 	if err != nil {
-		return c.Status(fiber.StatusBadRequest).JSON(fiber.Map{
-			"error": "Invalid agent_id format",
-		})
+		return nil, fiber.StatusBadRequest, "Invalid agent_id format"
 	}
 
 	// Get agent from database
 	agent, err := h.agentService.GetAgent(c.Context(), agentID)
 	if err != nil {
-		return c.Status(fiber.StatusNotFound).JSON(fiber.Map{
-			"error": "Agent not found",
-		})
+		return nil, fiber.StatusNotFound, "Agent not found"
 	}
 
 	// Verify agent is active
 	if agent.Status != domain.AgentStatusVerified && agent.Status != domain.AgentStatusPending {
-		return c.Status(fiber.StatusForbidden).JSON(fiber.Map{
-			"error": fmt.Sprintf("Agent status is %s, cannot perform actions", agent.Status),
-		})
+		return nil, fiber.StatusForbidden, fmt.Sprintf("Agent status is %s, cannot perform actions", agent.Status)
 	}
 
 	// Verify public key matches
 	publicKeyMatched := agent.PublicKey != nil && *agent.PublicKey == req.PublicKey
 	if !publicKeyMatched {
-		return c.Status(fiber.StatusUnauthorized).JSON(fiber.Map{
-			"error": "Public key mismatch",
-		})
+		return nil, fiber.StatusUnauthorized, "Public key mismatch"
 	}
 
 	// Verify signature
 	signatureVerified := false
 	if err := h.verifySignature(req); err != nil {
-		return c.Status(fiber.StatusUnauthorized).JSON(fiber.Map{
-			"error": fmt.Sprintf("Signature verification failed: %v", err),
-		})
+		return nil, fiber.StatusUnauthorized, fmt.Sprintf("Signature verification failed: %v", err)
 	}
 	signatureVerified = true
 
@@ -414,7 +417,172 @@ func (h *VerificationHandler) CreateVerification(c fiber.Ctx) error {
 		statusCode = fiber.StatusForbidden
 	}
 
-	return c.Status(statusCode).JSON(response)
+	return &response, statusCode, ""
+}
+
+// maxBulkVerificationChecks caps the number of checks accepted in one bulk request
+const maxBulkVerificationChecks = 100
+
+// chargeVerificationRateLimit counts every check of a multi-check request against the
+// shared verification rate limit. The limiter middleware already charged one unit for
+// the request itself; without a limiter on the route this always allows.
+func chargeVerificationRateLimit(c fiber.Ctx, checks int) bool {
+	charge, ok := c.Locals(middleware.RateLimitChargeKey).(func(int) bool)
+	return !ok || charge(checks-1)
+}
+
+// BulkVerificationRequest bundles several signed verification requests into one call
+type BulkVerificationRequest struct {
+	Checks []VerificationRequest `json:"checks" validate:"required"`
+}
+
+// BulkVerificationResult is the outcome of a single check within a bulk request
+type BulkVerificationResult struct {
+	VerificationResponse
+	StatusCode int    `json:"status_code"`
+	Error      string `json:"error,omitempty"`
+}
+
+// BulkVerificationResponse lists results in the same order as the submitted checks
+type BulkVerificationResponse struct {
+	Results []BulkVerificationResult `json:"results"`
+}
+
+// CreateVerificationBulk handles POST /api/v1/sdk-api/verifications/bulk
+// @Summary Request verification for several agent actions at once
+// @Description Verify each signed check exactly like CreateVerification, in a single round-trip
+// @Tags verifications
+// @Accept json
+// @Produce json
+// @Param request body BulkVerificationRequest true "Bulk verification request"
+// @Success 200 {object} BulkVerificationResponse "Per-check verification results"
+// @Failure 400 {object} ErrorResponse "Invalid request"
+// @Router /api/v1/sdk-api/verifications/bulk [post]
+func (h *VerificationHandler) CreateVerificationBulk(c fiber.Ctx) error {
+	var req BulkVerificationRequest
+	if err := c.Bind().JSON(&req); err != nil {
+		return c.Status(fiber.StatusBadRequest).JSON(fiber.Map{
+			"error": "Invalid request body",
+		})
+	}
+
+	if len(req.Checks) == 0 {
+		return c.Status(fiber.StatusBadRequest).JSON(fiber.Map{
+			"error": "checks must contain at least one verification request",
+		})
+	}
+
+	if len(req.Checks) > maxBulkVerificationChecks {
+		return c.Status(fiber.StatusBadRequest).JSON(fiber.Map{
+			"error": fmt.Sprintf("checks cannot contain more than %d verification requests", maxBulkVerificationChecks),
+		})
+	}
+
+	if !chargeVerificationRateLimit(c, len(req.Checks)) {
+		return c.Status(fiber.StatusTooManyRequests).JSON(fiber.Map{
+			"error": "Rate limit exceeded. Please try again later.",
+		})
+	}
+
+	results := make([]BulkVerificationResult, 0, len(req.Checks))
+	for _, check := range req.Checks {
+		response, statusCode, errMsg := h.processVerification(c, check)
+
+		result := BulkVerificationResult{
+			StatusCode: statusCode,
+			Error:      errMsg,
+		}
+		if response != nil {
+			result.VerificationResponse = *response
+		}
+		results = append(results, result)
+	}
+
+	return c.Status(fiber.StatusOK).JSON(BulkVerificationResponse{
+		Results: results,
+	})
+}
+
+// ScenarioRequest is a scripted sequence of signed actions run in one call
+type ScenarioRequest struct {
+	Steps []VerificationRequest `json:"steps" validate:"required"`
+}
+
+// ScenarioStepResult is the verification outcome of one step and whether its result was recorded
+type ScenarioStepResult struct {
+	BulkVerificationResult
+	Recorded bool `json:"recorded"`
+}
+
+// ScenarioResponse lists step results in the same order as the submitted steps
+type ScenarioResponse struct {
+	Steps []ScenarioStepResult `json:"steps"`
+}
+
+// RunScenario handles POST /api/v1/sdk-api/verifications/scenario
+// @Summary Run a scripted sequence of agent actions in one call
+// @Description Verify each signed step like CreateVerification and record a success result for approved steps
+// @Tags verifications
+// @Accept json
+// @Produce json
+// @Param request body ScenarioRequest true "Scenario request"
+// @Success 200 {object} ScenarioResponse "Per-step verification results"
+// @Failure 400 {object} ErrorResponse "Invalid request"
+// @Router /api/v1/sdk-api/verifications/scenario [post]
+func (h *VerificationHandler) RunScenario(c fiber.Ctx) error {
+	var req ScenarioRequest
+	if err := c.Bind().JSON(&req); err != nil {
+		return c.Status(fiber.StatusBadRequest).JSON(fiber.Map{
+			"error": "Invalid request body",
+		})
+	}
+
+	if len(req.Steps) == 0 {
+		return c.Status(fiber.StatusBadRequest).JSON(fiber.Map{
+			"error": "steps must contain at least one action",
+		})
+	}
+
+	if len(req.Steps) > maxBulkVerificationChecks {
+		return c.Status(fiber.StatusBadRequest).JSON(fiber.Map{
+			"error": fmt.Sprintf("steps cannot contain more than %d actions", maxBulkVerificationChecks),
+		})
+	}
+
+	if !chargeVerificationRateLimit(c, len(req.Steps)) {
+		return c.Status(fiber.StatusTooManyRequests).JSON(fiber.Map{
+			"error": "Rate limit exceeded. Please try again later.",
+		})
+	}
+
+	results := make([]ScenarioStepResult, 0, len(req.Steps))
+	for i, step := range req.Steps {
+		response, statusCode, errMsg := h.processVerification(c, step)
+
+		result := ScenarioStepResult{
+			BulkVerificationResult: BulkVerificationResult{
+				StatusCode: statusCode,
+				Error:      errMsg,
+			},
+		}
+		if response != nil {
+			result.VerificationResponse = *response
+
+			// Approved steps are executed as part of the scenario, so record their result now
+			if response.Status == "approved" {
+				if vid, err := uuid.Parse(response.ID); err == nil {
+					metadata := map[string]interface{}{"scenario_step": i + 1}
+					err = h.verificationEventService.UpdateVerificationResult(c.Context(), vid, domain.VerificationResultVerified, nil, metadata)
+					result.Recorded = err == nil
+				}
+			}
+		}
+		results = append(results, result)
+	}
+
+	return c.Status(fiber.StatusOK).JSON(ScenarioResponse{
+		Steps: results,
+	})
 }
 
 // customJSONFormat adds spaces after colons and commas to match Python's json.dumps format
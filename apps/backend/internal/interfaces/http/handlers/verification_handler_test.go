@@ -0,0 +1,73 @@
+package handlers
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/gofiber/fiber/v3"
+	"github.com/opena2a/identity/backend/internal/interfaces/http/middleware"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func postJSON(t *testing.T, app *fiber.App, path, body string) int {
+	req := httptest.NewRequest(http.MethodPost, path, strings.NewReader(body))
+	req.Header.Set("Content-Type", "application/json")
+	resp, err := app.Test(req)
+	require.NoError(t, err)
+	return resp.StatusCode
+}
+
+func TestChargeVerificationRateLimitChargesEveryCheck(t *testing.T) {
+	limiter := middleware.NewCountingRateLimiter(4, time.Minute)
+	app := fiber.New()
+	app.Post("/bulk", limiter.Handler(), func(c fiber.Ctx) error {
+		if !chargeVerificationRateLimit(c, 3) {
+			return c.SendStatus(fiber.StatusTooManyRequests)
+		}
+		return c.SendStatus(fiber.StatusOK)
+	})
+
+	// Three checks cost three units: one from the middleware, two from the handler
+	assert.Equal(t, fiber.StatusOK, postJSON(t, app, "/bulk", "{}"))
+	// One unit left, so the next three-check request is refused
+	assert.Equal(t, fiber.StatusTooManyRequests, postJSON(t, app, "/bulk", "{}"))
+}
+
+func TestChargeVerificationRateLimitWithoutLimiter(t *testing.T) {
+	app := fiber.New()
+	app.Post("/bulk", func(c fiber.Ctx) error {
+		if !chargeVerificationRateLimit(c, 100) {
+			return c.SendStatus(fiber.StatusTooManyRequests)
+		}
+		return c.SendStatus(fiber.StatusOK)
+	})
+
+	assert.Equal(t, fiber.StatusOK, postJSON(t, app, "/bulk", "{}"))
+}
+
+func TestBulkVerificationRateLimited(t *testing.T) {
+	// The rate limit is checked before any verification runs, so no services are needed
+	h := &VerificationHandler{}
+	limiter := middleware.NewCountingRateLimiter(2, time.Minute)
+	app := fiber.New()
+	app.Post("/bulk", limiter.Handler(), h.CreateVerificationBulk)
+
+	status := postJSON(t, app, "/bulk", `{"checks": [{}, {}, {}]}`)
+
+	assert.Equal(t, fiber.StatusTooManyRequests, status)
+}
+
+func TestScenarioRateLimited(t *testing.T) {
+	h := &VerificationHandler{}
+	limiter := middleware.NewCountingRateLimiter(2, time.Minute)
+	app := fiber.New()
+	app.Post("/scenario", limiter.Handler(), h.RunScenario)
+
+	status := postJSON(t, app, "/scenario", `{"steps": [{}, {}, {}]}`)
+
+	assert.Equal(t, fiber.StatusTooManyRequests, status)
+}
@@ -1,6 +1,7 @@
 package middleware
 
 import (
+	"sync"
 	"time"
 
 	"github.com/gofiber/fiber/v3"
@@ -50,3 +51,93 @@ func StrictRateLimitMiddleware() fiber.Handler {
 		},
 	})
 }
+
+// RateLimitChargeKey is the c.Locals key holding a func(n int) bool that charges
+// n extra units against the caller's CountingRateLimiter budget
+const RateLimitChargeKey = "rate_limit_charge"
+
+// CountingRateLimiter is a fixed-window limiter where one request may consume
+// several units, so a bulk request costs as much as the single requests it replaces.
+// One instance can be shared by several routes to give them a common budget.
+type CountingRateLimiter struct {
+	max     int
+	window  time.Duration
+	mu      sync.Mutex
+	windows map[string]*countingWindow
+	sweepAt time.Time
+}
+
+type countingWindow struct {
+	used    int
+	resetAt time.Time
+}
+
+// NewCountingRateLimiter creates a limiter allowing max units per window per caller
+func NewCountingRateLimiter(max int, window time.Duration) *CountingRateLimiter {
+	return &CountingRateLimiter{
+		max:     max,
+		window:  window,
+		windows: make(map[string]*countingWindow),
+		sweepAt: time.Now().Add(window),
+	}
+}
+
+// Allow consumes n units for key, returning false (and consuming nothing) if that exceeds the budget
+func (l *CountingRateLimiter) Allow(key string, n int) bool {
+	l.mu.Lock()
+	defer l.mu.Unlock()
+
+	now := time.Now()
+	if now.After(l.sweepAt) {
+		// Drop expired windows so idle callers don't accumulate
+		for k, w := range l.windows {
+			if now.After(w.resetAt) {
+				delete(l.windows, k)
+			}
+		}
+		l.sweepAt = now.Add(l.window)
+	}
+
+	w, ok := l.windows[key]
+	if !ok || now.After(w.resetAt) {
+		w = &countingWindow{resetAt: now.Add(l.window)}
+		l.windows[key] = w
+	}
+
+	if w.used+n > l.max {
+		return false
+	}
+	w.used += n
+	return true
+}
+
+// Handler charges one unit per request and exposes RateLimitChargeKey so handlers
+// can charge for additional work (e.g. each check in a bulk request)
+func (l *CountingRateLimiter) Handler() fiber.Handler {
+	return func(c fiber.Ctx) error {
+		key := rateLimitKey(c)
+		if !l.Allow(key, 1) {
+			return rateLimitExceeded(c)
+		}
+		c.Locals(RateLimitChargeKey, func(n int) bool {
+			return n <= 0 || l.Allow(key, n)
+		})
+		return c.Next()
+	}
+}
+
+// rateLimitKey rate limits by user if authenticated, otherwise by IP
+func rateLimitKey(c fiber.Ctx) string {
+	if userID := c.Locals("user_id"); userID != nil {
+		if id, ok := userID.(uuid.UUID); ok {
+			return id.String()
+		}
+	}
+	return c.IP()
+}
+
+func rateLimitExceeded(c fiber.Ctx) error {
+	return c.Status(fiber.StatusTooManyRequests).JSON(fiber.Map{
+		"error": "Rate limit exceeded. Please try again later.",
+	})
+}
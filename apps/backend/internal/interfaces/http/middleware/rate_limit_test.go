@@ -0,0 +1,60 @@
+package middleware
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+
+	"github.com/gofiber/fiber/v3"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestCountingRateLimiterAllow(t *testing.T) {
+	limiter := NewCountingRateLimiter(5, time.Minute)
+
+	assert.True(t, limiter.Allow("caller", 3))
+	assert.False(t, limiter.Allow("caller", 3), "charge past the budget should be refused")
+	assert.True(t, limiter.Allow("caller", 2), "refused charge should not consume units")
+	assert.False(t, limiter.Allow("caller", 1))
+	assert.True(t, limiter.Allow("other", 5), "callers should have separate budgets")
+}
+
+func TestCountingRateLimiterWindowResets(t *testing.T) {
+	limiter := NewCountingRateLimiter(1, 20*time.Millisecond)
+
+	assert.True(t, limiter.Allow("caller", 1))
+	assert.False(t, limiter.Allow("caller", 1))
+
+	time.Sleep(30 * time.Millisecond)
+	assert.True(t, limiter.Allow("caller", 1))
+}
+
+func TestCountingRateLimiterHandler(t *testing.T) {
+	limiter := NewCountingRateLimiter(4, time.Minute)
+	app := fiber.New()
+	app.Post("/bulk", limiter.Handler(), func(c fiber.Ctx) error {
+		charge, ok := c.Locals(RateLimitChargeKey).(func(int) bool)
+		require.True(t, ok, "handler should expose the charge func")
+		if !charge(2) {
+			return rateLimitExceeded(c)
+		}
+		return c.SendStatus(fiber.StatusOK)
+	})
+
+	// 1 unit for the request plus 2 charged by the handler
+	resp, err := app.Test(httptest.NewRequest(http.MethodPost, "/bulk", nil))
+	require.NoError(t, err)
+	assert.Equal(t, fiber.StatusOK, resp.StatusCode)
+
+	// The request unit fits, the extra charge does not
+	resp, err = app.Test(httptest.NewRequest(http.MethodPost, "/bulk", nil))
+	require.NoError(t, err)
+	assert.Equal(t, fiber.StatusTooManyRequests, resp.StatusCode)
+
+	// Budget is spent, so the middleware itself refuses
+	resp, err = app.Test(httptest.NewRequest(http.MethodPost, "/bulk", nil))
+	require.NoError(t, err)
+	assert.Equal(t, fiber.StatusTooManyRequests, resp.StatusCode)
+}
@@ -54,9 +54,26 @@ Agent Management (Generic SDK Pattern):
     details = client.get_agent_details(agent_id)
     updated = client.update_agent(display_name="New Name")
     client.delete_agent(agent_id)
+
+Async Usage (concurrent actions):
+    import asyncio
+    from aim_sdk import secure, AsyncAIMClient
+
+    async_agent = AsyncAIMClient(secure("my-agent"))
+
+    @async_agent.track_action(risk_level="low")
+    def get_weather(city):
+        return api.get(f"/weather?city={city}")
+
+    async def main():
+        await asyncio.gather(get_weather("NYC"), get_weather("LA"))
+        await async_agent.close()
+
+    asyncio.run(main())
 """
 
 from .client import AIMClient, register_agent
+from .async_client import AsyncAIMClient
 
 # Alias for enterprise security
 secure = register_agent
@@ -69,6 +86,7 @@ from .protocol_detection import ProtocolDetector, auto_detect_protocol
 __version__ = "1.0.0"
 __all__ = [
     "AIMClient",
+    "AsyncAIMClient",
     "register_agent",
     "secure",
     "AIMError",
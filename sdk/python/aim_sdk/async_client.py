@@ -0,0 +1,447 @@
+"""
+AIM Async Client - asyncio support for concurrent action verification
+
+Wraps an AIMClient so verification and result logging can be awaited, letting
+many I/O-bound actions run concurrently with asyncio.gather().
+
+Uses aiohttp when installed (pip install aim-sdk[async]); otherwise the
+blocking AIMClient calls run in the default thread pool executor.
+"""
+
+import asyncio
+import atexit
+import functools
+import inspect
+import time
+from typing import Any, Callable, Optional, Dict, Tuple
+from datetime import datetime, timezone
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+from .client import AIMClient, _pending_result
+from .serialization import dumps as json_dumps
+from .retry import async_call_with_retry
+from .exceptions import (
+    AuthenticationError,
+    VerificationError,
+    ActionDeniedError
+)
+
+
+class AsyncAIMClient:
+    """
+    Asyncio wrapper around AIMClient.
+
+    Shares the wrapped client's identity, keys and credentials. Network calls
+    are bounded by a semaphore so bursts of concurrent actions stay under
+    backend rate limits.
+
+    Args:
+        client: Registered AIMClient (e.g. from secure() or register_agent())
+        max_concurrency: Maximum number of in-flight requests (default: 8)
+
+    Example:
+        agent = secure("my-agent")
+        async_agent = AsyncAIMClient(agent)
+
+        @async_agent.track_action(risk_level="low")
+        def get_weather(city):
+            return api.get(f"/weather?city={city}")
+
+        async def main():
+            results = await asyncio.gather(get_weather("NYC"), get_weather("LA"))
+            await async_agent.close()
+
+        asyncio.run(main())
+    """
+
+    def __init__(self, client: AIMClient, max_concurrency: int = 8):
+        self.client = client
+        self.max_concurrency = max_concurrency
+
+        # Created lazily so they bind to the running event loop, and rebuilt when
+        # the client is used from another loop (e.g. a second asyncio.run())
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session = None
+
+    @property
+    def agent_id(self) -> str:
+        return self.client.agent_id
+
+    @property
+    def aim_url(self) -> str:
+        return self.client.aim_url
+
+    def _bind_to_running_loop(self):
+        """Forget the semaphore and session if they belong to an earlier event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        # A session from a finished loop can't be closed from this one; its
+        # connections died with that loop, so it is just dropped
+        self._loop = loop
+        self._semaphore = None
+        self._session = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        self._bind_to_running_loop()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _get_session(self):
+        self._bind_to_running_loop()
+        if self._session is None or self._session.closed:
+            # One keep-alive pool for every verification and result log
+            connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    'Content-Type': 'application/json',
+                    'User-Agent': 'AIM-Python-SDK/1.0.0'
+                },
+                timeout=aiohttp.ClientTimeout(total=self.client.timeout)
+            )
+            atexit.unregister(self._close_at_exit)
+            atexit.register(self._close_at_exit)
+        return self._session
+
+    def _close_at_exit(self):
+        """Best-effort close for sessions the caller never closed explicitly."""
+        session = self._session
+        if session is None or session.closed:
+            return
+        # asyncio.run() has usually closed the session's loop by now
+        loop = session.loop
+        if loop.is_running():
+            return
+        if loop.is_closed():
+            loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(session.close())
+        except Exception:
+            pass
+        finally:
+            if loop is not session.loop:
+                loop.close()
+
+    def _headers(self, authenticated: bool = False) -> Dict[str, str]:
+        """Build per-request headers (the session carries Content-Type and User-Agent)."""
+        headers = {}
+
+        if authenticated:
+            if self.client.api_key:
+                headers['X-API-Key'] = self.client.api_key
+            elif self.client.oauth_token_manager:
+                try:
+                    access_token = self.client.oauth_token_manager.get_access_token()
+                    if access_token:
+                        headers['Authorization'] = f'Bearer {access_token}'
+                except Exception:
+                    pass  # Continue without OAuth if it fails
+
+        # Add SDK token header if available (for usage tracking only, not auth)
+        if self.client.sdk_token_id:
+            headers['X-SDK-Token'] = self.client.sdk_token_id
+
+        return headers
+
+    async def _request(self, method: str, url: str, **kwargs) -> Tuple[int, str]:
+        """
+        Send a request and return (status, body text).
+
+        Failed connections are retried with jittered exponential backoff
+        (asyncio.sleep, so other tasks keep running) when the wrapped client
+        has auto_retry enabled; GETs also retry dropped connections and
+        timeouts. All attempts share one client.timeout budget.
+        """
+        async def attempt():
+            remaining = max(deadline - time.monotonic(), 0.001)
+            async with self._get_session().request(
+                method, url, timeout=aiohttp.ClientTimeout(total=remaining), **kwargs
+            ) as response:
+                return response.status, await response.text()
+
+        if method == "GET":
+            retry_on = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        else:
+            # Only errors raised before the request went out; a dropped connection
+            # (ServerDisconnectedError) or a timeout may mean AIM already handled it
+            retry_on = (aiohttp.ClientConnectorError,)
+            if hasattr(aiohttp, "ConnectionTimeoutError"):  # aiohttp >= 3.10
+                retry_on += (aiohttp.ConnectionTimeoutError,)
+
+        attempts = self.client.max_retries + 1 if self.client.auto_retry else 1
+        async with self._get_semaphore():
+            # Budget starts once a slot is free, not while queued behind other requests
+            deadline = time.monotonic() + self.client.timeout
+            return await async_call_with_retry(
+                attempt, retry_on, attempts, deadline=deadline
+            )
+
+    async def _run_sync(self, func: Callable, *args, **kwargs):
+        """Run a blocking AIMClient call in the default executor."""
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore():
+            return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def verify_action(
+        self,
+        action_type: str,
+        resource: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        timeout_seconds: int = 300
+    ) -> Dict:
+        """
+        Request verification for an action from AIM without blocking the event loop.
+
+        Same arguments, return value and exceptions as AIMClient.verify_action().
+        """
+        if not AIOHTTP_AVAILABLE:
+            return await self._run_sync(
+                self.client.verify_action,
+                action_type=action_type,
+                resource=resource,
+                context=context,
+                timeout_seconds=timeout_seconds
+            )
+
+        cached = self.client._verification_shortcut(action_type, resource, context)
+        if cached is not None:
+            return cached
+
+        request_payload = self.client._build_verification_payload(action_type, resource, context)
+        url = f"{self.aim_url}/api/v1/sdk-api/verifications"
+
+        try:
+            status_code, text = await self._request(
+                "POST", url, data=json_dumps(request_payload), headers=self._headers()
+            )
+            result = self.client._verification_result(status_code, text, action_type, resource)
+
+            if result.get("status") == "pending" and result["verification_id"]:
+                return await self._wait_for_approval(result["verification_id"], timeout_seconds)
+            return result
+
+        except (AuthenticationError, ActionDeniedError):
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f" Warning: Network error during verification: {type(e).__name__}: {str(e)}")
+            print(f"   Returning default 'pending' status. Action will be treated as requiring approval.")
+            return _pending_result(f"Network error: {type(e).__name__}: {str(e)}")
+        except Exception as e:
+            print(f"  Warning: Unexpected error during verification: {type(e).__name__}: {str(e)}")
+            print(f"   Returning default 'pending' status.")
+            return _pending_result(f"Unexpected error: {type(e).__name__}: {str(e)}")
+
+    async def _wait_for_approval(self, verification_id: str, timeout_seconds: int) -> Dict:
+        """
+        Poll AIM server for verification approval using asyncio.sleep between polls.
+
+        Raises:
+            ActionDeniedError: If action is denied
+            VerificationError: If timeout or polling fails
+        """
+        start_time = time.time()
+        poll_interval = 2  # Start with 2 second polls
+        url = f"{self.aim_url}/api/v1/sdk-api/verifications/{verification_id}"
+
+        while time.time() - start_time < timeout_seconds:
+            try:
+                status_code, text = await self._request(
+                    "GET", url, headers=self._headers(authenticated=True)
+                )
+                result = self.client._approval_poll_result(verification_id, status_code, text)
+                if result is not None:
+                    return result
+
+            except (AuthenticationError, ActionDeniedError, VerificationError):
+                raise
+            except Exception as e:
+                # Continue polling on transient network or parsing errors
+                print(f"  Warning: Error while polling: {type(e).__name__}: {str(e)}")
+
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 1.5, 10)  # Exponential backoff up to 10s
+
+        raise VerificationError(f"Verification timeout after {timeout_seconds} seconds")
+
+    async def log_action_result(
+        self,
+        verification_id: str,
+        success: bool,
+        result_summary: Optional[str] = None,
+        error_message: Optional[str] = None
+    ):
+        """
+        Log the result of an action execution to AIM.
+
+        Same arguments as AIMClient.log_action_result(). Never raises.
+        """
+        if not verification_id:
+            return
+
+        if not AIOHTTP_AVAILABLE:
+            await self._run_sync(
+                self.client.log_action_result,
+                verification_id=verification_id,
+                success=success,
+                result_summary=result_summary,
+                error_message=error_message
+            )
+            return
+
+        try:
+            url = f"{self.aim_url}/api/v1/sdk-api/verifications/{verification_id}/result"
+            payload = {
+                "result": "success" if success else "failure",
+                "result_summary": result_summary,
+                "error_message": error_message,
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+
+            await self._request(
+                "POST", url, data=json_dumps(payload), headers=self._headers(authenticated=True)
+            )
+        except Exception:
+            # Don't fail the action if logging fails
+            pass
+
+    def track_action(
+        self,
+        risk_level: str = "low",
+        action_name: Optional[str] = None,
+        resource: Optional[str] = None
+    ):
+        """
+        Decorator for automatic action tracking that produces coroutine functions.
+
+        Behaves like AIMClient.track_action(), but the decorated function must be
+        awaited. Both regular and async functions can be decorated; regular
+        functions run in the default thread pool executor.
+
+        Example:
+            @async_agent.track_action(risk_level="low")
+            def get_weather(city):
+                return api.get(f"/weather?city={city}")
+
+            weather = await get_weather("San Francisco")
+        """
+        def decorator(func: Callable) -> Callable:
+            # Everything that doesn't depend on call arguments is built once here
+            action = action_name or func.__name__
+            base_context = {
+                "risk_level": risk_level,
+                "function_name": func.__name__,
+                "module": func.__module__
+            }
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                # Build context with risk level
+                context = base_context.copy()
+
+                # Add args/kwargs to context (for audit trail)
+                if args:
+                    context["args"] = str(args)
+                if kwargs:
+                    context["kwargs"] = str(kwargs)
+
+                try:
+                    verification_result = await self.verify_action(
+                        action_type=action,
+                        resource=resource,
+                        context=context,
+                        timeout_seconds=300
+                    )
+                except Exception as e:
+                    print(f"  Warning: Verification request failed: {type(e).__name__}: {str(e)}")
+                    print(f"   Action '{action}' cannot proceed without verification.")
+                    return {
+                        "error": True,
+                        "error_type": type(e).__name__,
+                        "error_message": str(e),
+                        "action": action,
+                        "status": "verification_failed"
+                    }
+
+                if verification_result.get("error"):
+                    error_msg = verification_result.get("error", "Unknown verification error")
+                    print(f"  Warning: Verification returned error: {error_msg}")
+                    print(f"   Action '{action}' cannot proceed without successful verification.")
+                    return {
+                        "error": True,
+                        "error_type": "VerificationError",
+                        "error_message": error_msg,
+                        "action": action,
+                        "status": "verification_failed"
+                    }
+
+                if not verification_result.get("verified", False):
+                    reason = verification_result.get("reason", verification_result.get("error", "Unknown reason"))
+                    print(f" Warning: Action '{action}' not verified: {reason}")
+                    return {
+                        "error": True,
+                        "error_type": "ActionDenied",
+                        "error_message": f"Action '{action}' denied: {reason}",
+                        "action": action,
+                        "status": "denied"
+                    }
+
+                verification_id = verification_result.get("verification_id")
+
+                try:
+                    if inspect.iscoroutinefunction(func):
+                        result = await func(*args, **kwargs)
+                    else:
+                        # Blocking functions run in the default executor so other tasks keep going
+                        loop = asyncio.get_running_loop()
+                        result = await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+                        if inspect.isawaitable(result):
+                            result = await result
+
+                    await self.log_action_result(
+                        verification_id=verification_id,
+                        success=True,
+                        result_summary=f"Action '{action}' completed successfully"
+                    )
+                    return result
+
+                except Exception as e:
+                    await self.log_action_result(
+                        verification_id=verification_id,
+                        success=False,
+                        error_message=str(e)
+                    )
+
+                    print(f" Error executing action '{action}': {type(e).__name__}: {str(e)}")
+                    return {
+                        "error": True,
+                        "error_type": type(e).__name__,
+                        "error_message": str(e),
+                        "action": action,
+                        "status": "execution_failed"
+                    }
+
+            return wrapper
+        return decorator
+
+    async def close(self):
+        """Close the aiohttp session (the wrapped AIMClient stays open)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        atexit.unregister(self._close_at_exit)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
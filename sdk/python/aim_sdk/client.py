@@ -11,6 +11,8 @@ from typing import Any, Callable, Optional, Dict, List
 from datetime import datetime, timezone
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
 from nacl.signing import SigningKey, VerifyKey
 from nacl.encoding import Base64Encoder
 
@@ -21,9 +23,61 @@ from .exceptions import (
     ConfigurationError
 )
 from .oauth import OAuthTokenManager, load_sdk_credentials
+from .cache import TTLCache
+from .serialization import dumps as json_dumps
+from .retry import backoff_delay, call_with_retry
 from .capability_detection import auto_detect_capabilities
 
 
+# Transient failures worth retrying. POSTs create verification events, result records and
+# agents, so they only retry failures to connect (see _connect_failed): a read timeout or a
+# dropped connection may mean the server already handled the request.
+RETRYABLE_ERRORS = (requests.exceptions.ConnectionError,)
+IDEMPOTENT_RETRYABLE_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+# Time budget for agent registration, shared by all attempts
+REGISTRATION_TIMEOUT = 30
+
+# Keep-alive pool size per host; large enough for AsyncAIMClient's executor fallback
+HTTP_POOL_MAXSIZE = 32
+
+
+def _pending_result(error_msg: str) -> Dict:
+    """Result for a verification that could not be completed; callers treat it as requiring approval."""
+    return {
+        "verified": False,
+        "verification_id": None,
+        "status": "pending",
+        "error": error_msg
+    }
+
+
+def _http_error_message(status_code: int, text: str) -> str:
+    """Describe an HTTP error response, preferring the server's "error" field."""
+    error_msg = f"HTTP {status_code} error"
+    try:
+        return f"{error_msg}: {json.loads(text).get('error', text)}"
+    except Exception:
+        return f"{error_msg}: {text[:200]}"
+
+
+def _connect_failed(error: BaseException) -> bool:
+    """True if the request never reached the server (connection refused, DNS failure, connect timeout)."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _new_http_session() -> requests.Session:
+    """Create a requests.Session whose keep-alive pool is shared by all SDK calls."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class AIMClient:
     """
     AIM SDK Client for automatic identity verification.
@@ -39,6 +93,9 @@ class AIMClient:
         timeout: HTTP request timeout in seconds (default: 30)
         auto_retry: Whether to automatically retry failed requests (default: True)
         max_retries: Maximum number of retry attempts (default: 3)
+        verify_cache_ttl: Seconds to reuse approved verifications for the same
+            action and resource (default: 0, disabled)
+        session: Existing requests.Session to reuse (default: new pooled session)
 
     Example:
         client = AIMClient(
@@ -64,7 +121,9 @@ class AIMClient:
         auto_retry: bool = True,
         max_retries: int = 3,
         sdk_token_id: Optional[str] = None,
-        oauth_token_manager: Optional[Any] = None
+        oauth_token_manager: Optional[Any] = None,
+        verify_cache_ttl: float = 0,
+        session: Optional[requests.Session] = None
     ):
         # Validate required parameters
         if not agent_id:
@@ -125,8 +184,8 @@ class AIMClient:
 
         self.sdk_token_id = sdk_token_id
 
-        # Session for connection pooling
-        self.session = requests.Session()
+        # Session for connection pooling (reuses the registration connection if passed in)
+        self.session = session or _new_http_session()
         headers = {
             'User-Agent': f'AIM-Python-SDK/1.0.0',
             'Content-Type': 'application/json'
@@ -138,6 +197,133 @@ class AIMClient:
 
         self.session.headers.update(headers)
 
+        # Optional local pre-check against granted capabilities (see refresh_capabilities)
+        self.local_capability_check = False
+        self.declared_capabilities: Optional[frozenset] = None
+        self._capability_namespaces: frozenset = frozenset()
+        self._capability_prefixes: tuple = ()
+
+        # Approved verifications keyed by (action_type, resource namespace)
+        self._verify_cache: Optional[TTLCache] = None
+        if verify_cache_ttl > 0:
+            self.enable_verify_cache(verify_cache_ttl)
+
+    def set_declared_capabilities(self, capabilities: Optional[List[str]]):
+        """
+        Record the agent's capabilities for the local capability pre-check.
+
+        When local_capability_check is enabled, namespaced actions (e.g.,
+        "file:write") whose namespace matches no recorded capability are denied
+        without contacting AIM. Wildcard capabilities (e.g., "file:*") are honored.
+
+        The list is a snapshot: AIM enforces the capabilities granted to the
+        agent, which change when an admin grants or revokes one. Use
+        refresh_capabilities() to load the granted set from AIM.
+
+        Args:
+            capabilities: Capability types (e.g., ["api:call", "database:read"]),
+                or None to let AIM decide every action
+        """
+        if not capabilities:
+            self.declared_capabilities = None
+            self._capability_namespaces = frozenset()
+            self._capability_prefixes = ()
+            return
+
+        self.declared_capabilities = frozenset(capabilities)
+        self._capability_namespaces = frozenset(
+            capability.split(':', 1)[0] for capability in capabilities if ':' in capability
+        )
+        self._capability_prefixes = tuple(
+            capability[:-1] for capability in capabilities if capability.endswith('*')
+        )
+
+    def refresh_capabilities(self):
+        """
+        Reload the local pre-check from the capabilities AIM has granted the agent.
+
+        If AIM cannot be reached, the local pre-check is switched off until the
+        next refresh so a stale list never denies a granted action.
+        """
+        try:
+            result = self._make_request(
+                method="GET",
+                endpoint=f"/api/v1/sdk-api/agents/{self.agent_id}"
+            )
+            granted = [
+                capability["capabilityType"]
+                for capability in result["agent"].get("capabilities") or []
+            ]
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(f"Failed to refresh granted capabilities: {e}")
+            granted = None
+
+        self.set_declared_capabilities(granted)
+
+    def _check_declared_capability(self, action_type: str) -> Optional[Dict]:
+        """
+        Deny an ungranted action locally, before any HTTP call.
+
+        Returns:
+            A denied verification result, or None if AIM must decide
+        """
+        if not self.local_capability_check or self.declared_capabilities is None:
+            return None
+
+        namespace, separator, _ = action_type.partition(':')
+        if not separator or namespace in self._capability_namespaces:
+            return None
+        if action_type.startswith(self._capability_prefixes):
+            return None
+
+        return {
+            "verified": False,
+            "verification_id": None,
+            "status": "denied",
+            "reason": "capability not granted",
+            "local": True
+        }
+
+    def _verify_cache_key(self, action_type: str, resource: Optional[str]) -> tuple:
+        """
+        Cache key collapsing "namespace:id" resources to their namespace (user:123 -> user).
+
+        URLs and paths are kept whole, so an approval for one endpoint or file
+        is never reused for another.
+        """
+        if resource and ':' in resource and '/' not in resource:
+            return (action_type, resource.split(':', 1)[0])
+        return (action_type, resource)
+
+    def enable_verify_cache(self, ttl: float = 60, maxsize: int = 1024):
+        """
+        Reuse approved verifications within a session instead of asking AIM each time.
+
+        Results are keyed by action type and resource namespace, so "user:123"
+        and "user:456" share an entry; URLs and paths are matched exactly.
+        Cached hits are not re-audited by AIM: they return "cached": True and
+        no verification_id, and no action result is logged for them.
+
+        Args:
+            ttl: Seconds an approval is reused (default: 60)
+            maxsize: Maximum number of cached approvals (default: 1024)
+        """
+        self._verify_cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def invalidate_verify_cache(self):
+        """
+        Drop cached verification results.
+
+        Call this after capabilities or security policies change so the next
+        verify_action() asks AIM again. When local_capability_check is enabled,
+        the granted capabilities are reloaded as well.
+        """
+        if self._verify_cache is not None:
+            self._verify_cache.clear()
+        if self.local_capability_check:
+            self.refresh_capabilities()
+
     def _sign_message(self, message: str) -> str:
         """
         Sign a message using Ed25519 private key.
@@ -153,6 +339,29 @@ class AIMClient:
         signature = signed.signature
         return base64.b64encode(signature).decode('utf-8')
 
+    def _send_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        session.request() with jittered exponential backoff on transient network errors.
+
+        Retries up to max_retries times when auto_retry is enabled. GETs
+        retry connection errors and timeouts; other methods only retry when
+        the connection could not be established. All attempts share one
+        self.timeout budget, and the last error is re-raised once retries or
+        time are exhausted.
+        """
+        attempts = self.max_retries + 1 if self.auto_retry else 1
+        deadline = time.monotonic() + self.timeout
+
+        def attempt():
+            remaining = max(deadline - time.monotonic(), 0.001)
+            return self.session.request(method=method, url=url, timeout=remaining, **kwargs)
+
+        if method == "GET":
+            return call_with_retry(attempt, IDEMPOTENT_RETRYABLE_ERRORS, attempts, deadline=deadline)
+        return call_with_retry(
+            attempt, RETRYABLE_ERRORS, attempts, deadline=deadline, retry_if=_connect_failed
+        )
+
     def _make_request(
         self,
         method: str,
@@ -268,7 +477,7 @@ class AIMClient:
 
             # Retry on server errors if enabled
             if response.status_code >= 500 and self.auto_retry and retry_count < self.max_retries:
-                time.sleep(2 ** retry_count)  # Exponential backoff
+                time.sleep(backoff_delay(retry_count, base=1.0, cap=8.0))  # Exponential backoff with jitter
                 return self._make_request(method, endpoint, data, retry_count + 1)
 
             # Debug 400 errors (disabled in production)
@@ -280,57 +489,38 @@ class AIMClient:
 
         except requests.exceptions.Timeout:
             if self.auto_retry and retry_count < self.max_retries:
-                time.sleep(2 ** retry_count)
+                time.sleep(backoff_delay(retry_count, base=1.0, cap=8.0))
                 return self._make_request(method, endpoint, data, retry_count + 1)
             raise VerificationError("Request timeout")
 
         except requests.exceptions.ConnectionError:
             if self.auto_retry and retry_count < self.max_retries:
-                time.sleep(2 ** retry_count)
+                time.sleep(backoff_delay(retry_count, base=1.0, cap=8.0))
                 return self._make_request(method, endpoint, data, retry_count + 1)
             raise VerificationError("Connection failed")
 
         except requests.exceptions.RequestException as e:
             raise VerificationError(f"Request failed: {e}")
 
-    def verify_action(
+    def _build_verification_payload(
         self,
         action_type: str,
         resource: Optional[str] = None,
-        context: Optional[Dict[str, Any]] = None,
-        timeout_seconds: int = 300
+        context: Optional[Dict[str, Any]] = None
     ) -> Dict:
         """
-        Request verification for an action from AIM.
-
-        This method:
-        1. Creates a verification request with action details
-        2. Signs the request with the agent's private key
-        3. Sends the request to AIM
-        4. Waits for approval/denial (up to timeout_seconds)
-        5. Returns verification result
+        Build a signed verification request payload.
 
         Args:
             action_type: Type of action (e.g., "read_database", "send_email")
-            resource: Resource being accessed (e.g., "users_table", "admin@example.com")
+            resource: Resource being accessed
             context: Additional context about the action
-            timeout_seconds: Maximum time to wait for approval (default: 300s = 5min)
 
         Returns:
-            Verification result dict with keys:
-            - verified: bool (whether action is approved)
-            - verification_id: str (unique ID for this verification)
-            - approved_by: str (user who approved, if applicable)
-            - expires_at: str (ISO timestamp when approval expires)
-
-        Raises:
-            ActionDeniedError: If action is explicitly denied
-            VerificationError: If verification request fails
+            Request payload dict including the Ed25519 signature and public key
         """
-        # Create verification request payload
         timestamp = datetime.utcnow().isoformat() + 'Z'  # Match backend expected format
 
-
         # Create signature for Ed25519 verification
         # The backend verifies the signature by reconstructing the JSON payload
         # We need to create a signature of the JSON payload itself
@@ -341,14 +531,14 @@ class AIMClient:
             "resource": resource,
             "timestamp": timestamp
         }
-        
+
         # Create deterministic JSON (sorted keys, spaces after colons and commas)
         signature_message = json.dumps(signature_payload, sort_keys=True, separators=(', ', ': '))
 
         # Sign with Ed25519
         signature = self._sign_message(signature_message)
 
-        request_payload = {
+        return {
             "agent_id": self.agent_id,
             "action_type": action_type,
             "resource": resource,
@@ -358,6 +548,205 @@ class AIMClient:
             "public_key": self.public_key  # Public key in body
         }
 
+    def _verification_shortcut(
+        self,
+        action_type: str,
+        resource: Optional[str],
+        context: Optional[Dict[str, Any]]
+    ) -> Optional[Dict]:
+        """
+        Answer a verification without contacting AIM, if possible.
+
+        Shared by AIMClient and AsyncAIMClient before they send a request.
+
+        Returns:
+            A cached approval, or None if AIM must be asked
+
+        Raises:
+            ActionDeniedError: If the action is outside the granted capabilities
+        """
+        # Ungranted capability namespaces are a definite denial - skip the round-trip
+        local_result = self._check_declared_capability(action_type)
+        if local_result is not None:
+            raise ActionDeniedError(f"Action denied: {local_result['reason']}")
+
+        # Reuse a recent approval for the same action and resource namespace
+        if self._verify_cache is not None:
+            cached = self._verify_cache.get(self._verify_cache_key(action_type, resource))
+            if cached is not None:
+                return {**cached, "verification_id": None, "cached": True}
+        return None
+
+    def _verification_result(
+        self,
+        status_code: int,
+        text: str,
+        action_type: str,
+        resource: Optional[str]
+    ) -> Dict:
+        """
+        Map a verification response to a result dict.
+
+        Shared by AIMClient and AsyncAIMClient. Approvals are cached when the
+        verification cache is enabled. A "pending" result with a verification_id
+        still needs polling (_wait_for_approval); without one, the request failed
+        and the action is treated as requiring approval.
+
+        Raises:
+            AuthenticationError: On 401/403
+            ActionDeniedError: If AIM denied the action
+            VerificationError: On an unknown verification status
+        """
+        # Handle authentication errors
+        if status_code == 401:
+            try:
+                error_detail = json.loads(text).get("error", "unknown error")
+            except Exception:
+                error_detail = text
+            raise AuthenticationError(f"Authentication failed - invalid agent credentials: {error_detail}")
+
+        # Handle forbidden errors
+        if status_code == 403:
+            raise AuthenticationError("Forbidden - insufficient permissions")
+
+        # Handle 404 - endpoint not found (server may not be running or endpoint doesn't exist)
+        if status_code == 404:
+            print(f" Warning: AIM verification endpoint not found (404). Server may not be running.")
+            print(f"   Returning default 'pending' status. Action will be treated as requiring approval.")
+            return _pending_result("Endpoint not found - server may not be available")
+
+        # Handle other HTTP errors gracefully
+        if status_code >= 400:
+            error_msg = _http_error_message(status_code, text)
+            print(f" Warning: Verification request failed: {error_msg}")
+            print(f"   Returning default 'pending' status.")
+            return _pending_result(error_msg)
+
+        try:
+            result = json.loads(text)
+        except json.JSONDecodeError as e:
+            print(f"  Warning: Invalid JSON response from server: {str(e)}")
+            print(f"   Returning default 'pending' status.")
+            return _pending_result(f"JSON decode error: {str(e)}")
+
+        verification_id = result.get("id")
+        status = result.get("status")
+
+        # If auto-approved, return immediately
+        if status == "approved":
+            approved = {
+                "verified": True,
+                "verification_id": verification_id,
+                "approved_by": result.get("approved_by"),
+                "expires_at": result.get("expires_at")
+            }
+            if self._verify_cache is not None:
+                self._verify_cache.set(self._verify_cache_key(action_type, resource), approved)
+            return dict(approved)
+
+        # If denied, raise error
+        if status == "denied":
+            reason = result.get("denial_reason", "Action denied by policy")
+            raise ActionDeniedError(f"Action denied: {reason}")
+
+        if status == "pending":
+            return {
+                "verified": False,
+                "verification_id": verification_id,
+                "status": "pending"
+            }
+
+        raise VerificationError(f"Unexpected verification status: {status}")
+
+    def _approval_poll_result(self, verification_id: str, status_code: int, text: str) -> Optional[Dict]:
+        """
+        Map one approval poll response, shared by AIMClient and AsyncAIMClient.
+
+        Returns:
+            The approved result, or None to keep polling
+
+        Raises:
+            AuthenticationError: On 401/403
+            ActionDeniedError: If the action was denied
+            VerificationError: If the verification endpoint is missing
+            json.JSONDecodeError: On an unparseable body (callers keep polling)
+        """
+        # Handle authentication errors
+        if status_code == 401:
+            raise AuthenticationError("Authentication failed - invalid agent credentials")
+
+        # Handle forbidden errors
+        if status_code == 403:
+            raise AuthenticationError("Forbidden - insufficient permissions")
+
+        # Handle 404 - endpoint not found
+        if status_code == 404:
+            print(f" Warning: Verification endpoint not found (404). Cannot poll for approval.")
+            raise VerificationError("Verification endpoint not available - cannot complete approval process")
+
+        # Continue polling on other HTTP errors, but log the issue
+        if status_code >= 400:
+            print(f" Warning: Error polling verification status: {_http_error_message(status_code, text)}")
+            return None
+
+        result = json.loads(text)
+        status = result.get("status")
+
+        if status == "approved":
+            return {
+                "verified": True,
+                "verification_id": verification_id,
+                "approved_by": result.get("approved_by"),
+                "expires_at": result.get("expires_at")
+            }
+
+        if status == "denied":
+            reason = result.get("denial_reason", "Action denied")
+            raise ActionDeniedError(f"Action denied: {reason}")
+
+        # Still pending
+        return None
+
+    def verify_action(
+        self,
+        action_type: str,
+        resource: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        timeout_seconds: int = 300
+    ) -> Dict:
+        """
+        Request verification for an action from AIM.
+
+        This method:
+        1. Creates a verification request with action details
+        2. Signs the request with the agent's private key
+        3. Sends the request to AIM
+        4. Waits for approval/denial (up to timeout_seconds)
+        5. Returns verification result
+
+        Args:
+            action_type: Type of action (e.g., "read_database", "send_email")
+            resource: Resource being accessed (e.g., "users_table", "admin@example.com")
+            context: Additional context about the action
+            timeout_seconds: Maximum time to wait for approval (default: 300s = 5min)
+
+        Returns:
+            Verification result dict with keys:
+            - verified: bool (whether action is approved)
+            - verification_id: str (unique ID for this verification)
+            - approved_by: str (user who approved, if applicable)
+            - expires_at: str (ISO timestamp when approval expires)
+
+        Raises:
+            ActionDeniedError: If action is explicitly denied
+            VerificationError: If verification request fails
+        """
+        cached = self._verification_shortcut(action_type, resource, context)
+        if cached is not None:
+            return cached
+
+        request_payload = self._build_verification_payload(action_type, resource, context)
+
         # SDK API endpoint
         endpoint = "/api/v1/sdk-api/verifications"
 
@@ -376,113 +765,245 @@ class AIMClient:
             if self.sdk_token_id:
                 headers['X-SDK-Token'] = self.sdk_token_id
             
-            response = self.session.request(
+            response = self._send_request(
                 method="POST",
                 url=url,
-                json=request_payload,
-                headers=headers,
-                timeout=self.timeout
+                data=json_dumps(request_payload),
+                headers=headers
             )
 
-            # Handle authentication errors
-            if response.status_code == 401:
-                try:
-                    error_detail = response.json().get("error", "unknown error")
-                except:
-                    error_detail = response.text
-                raise AuthenticationError(f"Authentication failed - invalid agent credentials: {error_detail}")
+            result = self._verification_result(
+                response.status_code, response.text, action_type, resource
+            )
 
-            # Handle forbidden errors
-            if response.status_code == 403:
-                raise AuthenticationError("Forbidden - insufficient permissions")
+            # If pending, poll for result
+            if result.get("status") == "pending" and result["verification_id"]:
+                return self._wait_for_approval(result["verification_id"], timeout_seconds)
+            return result
 
-            # Handle 404 - endpoint not found (server may not be running or endpoint doesn't exist)
-            if response.status_code == 404:
-                print(f" Warning: AIM verification endpoint not found (404). Server may not be running.")
-                print(f"   Returning default 'pending' status. Action will be treated as requiring approval.")
-                return {
-                    "verified": False,
-                    "verification_id": None,
-                    "status": "pending",
-                    "error": "Endpoint not found - server may not be available"
-                }
+        except (AuthenticationError, ActionDeniedError):
+            raise
+        except requests.exceptions.RequestException as e:
+            # Handle network errors (connection refused, timeout, etc.)
+            print(f" Warning: Network error during verification: {type(e).__name__}: {str(e)}")
+            print(f"   Returning default 'pending' status. Action will be treated as requiring approval.")
+            return _pending_result(f"Network error: {type(e).__name__}: {str(e)}")
+        except Exception as e:
+            # Catch all other exceptions
+            print(f"  Warning: Unexpected error during verification: {type(e).__name__}: {str(e)}")
+            print(f"   Returning default 'pending' status.")
+            return _pending_result(f"Unexpected error: {type(e).__name__}: {str(e)}")
 
-            # Handle other HTTP errors gracefully
-            if response.status_code >= 400:
-                error_msg = f"HTTP {response.status_code} error"
-                try:
-                    error_detail = response.json().get("error", response.text)
-                    error_msg = f"{error_msg}: {error_detail}"
-                except:
-                    error_msg = f"{error_msg}: {response.text[:200]}"
-                
-                print(f" Warning: Verification request failed: {error_msg}")
-                print(f"   Returning default 'pending' status.")
-                return {
-                    "verified": False,
-                    "verification_id": None,
-                    "status": "pending",
-                    "error": error_msg
-                }
+    def verify_action_bulk(self, checks: List[Dict[str, Any]]) -> List[Dict]:
+        """
+        Request verification for several actions in a single round-trip.
 
-            response.raise_for_status()
-            result = response.json()
+        Each check is signed individually and evaluated by AIM exactly like
+        verify_action(), but all checks share one HTTP request. Denied checks
+        are returned as results instead of raising, and pending checks are not
+        polled - use verify_action() when you need to wait for approval.
 
-            verification_id = result.get("id")
-            status = result.get("status")
+        Args:
+            checks: List of dicts with keys:
+                - action_type: str - Type of action
+                - resource: str - Resource being accessed (optional)
+                - context: Dict - Additional context (optional)
 
-            # If auto-approved, return immediately
-            if status == "approved":
-                return {
-                    "verified": True,
-                    "verification_id": verification_id,
-                    "approved_by": result.get("approved_by"),
-                    "expires_at": result.get("expires_at")
-                }
+        Returns:
+            List of verification result dicts, in the same order as checks.
+            Each dict has keys:
+            - verified: bool (whether action is approved)
+            - verification_id: str (unique ID for this verification)
+            - status: str ("approved", "denied", or "pending")
+            - reason: str (denial reason, if denied)
+            - error: str (if the check could not be evaluated)
+
+        Example:
+            results = client.verify_action_bulk([
+                {"action_type": "read_database", "resource": "users_table"},
+                {"action_type": "file:write", "resource": "debug.txt"},
+            ])
+            for result in results:
+                print(result["status"])
+        """
+        if not checks:
+            return []
+
+        # Deny ungranted capabilities locally and only send the rest to AIM
+        results = [
+            self._check_declared_capability(check["action_type"])
+            for check in checks
+        ]
+        remote_checks = [check for check, result in zip(checks, results) if result is None]
+        if not remote_checks:
+            return results
+
+        remote_results = iter(self._send_verification_bulk(remote_checks))
+        return [result if result is not None else next(remote_results) for result in results]
+
+    def run_scenario(self, steps: List[Dict[str, Any]]) -> List[Dict]:
+        """
+        Run a scripted sequence of actions in a single round-trip.
 
-            # If denied, raise error
-            if status == "denied":
-                reason = result.get("denial_reason", "Action denied by policy")
-                raise ActionDeniedError(f"Action denied: {reason}")
+        Each step is signed and verified like verify_action(); AIM records a
+        success result for every approved step, so no separate
+        log_action_result() call is needed. Use this for showcase or replay
+        flows where the actions themselves have no local side effects.
 
-            # If pending, poll for result
-            if status == "pending":
-                return self._wait_for_approval(verification_id, timeout_seconds)
+        Args:
+            steps: List of dicts with keys:
+                - action_type: str - Type of action
+                - resource: str - Resource being accessed (optional)
+                - context: Dict - Additional context, e.g. call arguments (optional)
 
-            raise VerificationError(f"Unexpected verification status: {status}")
+        Returns:
+            List of verification result dicts, in the same order as steps,
+            with the same keys as verify_action_bulk() plus:
+            - recorded: bool (whether AIM recorded the step's result)
+
+        Example:
+            results = client.run_scenario([
+                {"action_type": "check_weather", "context": {"args": {"city": "New York"}}},
+                {"action_type": "query_orders", "resource": "database:read"},
+            ])
+        """
+        if not steps:
+            return []
+
+        # Deny ungranted capabilities locally and only send the rest to AIM
+        results = [
+            self._check_declared_capability(step["action_type"])
+            for step in steps
+        ]
+        remote_steps = [step for step, result in zip(steps, results) if result is None]
+        if not remote_steps:
+            return results
+
+        body = {"steps": self._build_verification_payloads(remote_steps)}
+
+        remote_results = iter(self._post_verification_batch("scenario", body, "steps", len(remote_steps)))
+        return [result if result is not None else next(remote_results) for result in results]
+
+    def _build_verification_payloads(self, checks: List[Dict[str, Any]]) -> List[Dict]:
+        return [
+            self._build_verification_payload(
+                check["action_type"],
+                check.get("resource"),
+                check.get("context")
+            )
+            for check in checks
+        ]
+
+    def _send_verification_bulk(self, checks: List[Dict[str, Any]]) -> List[Dict]:
+        """
+        Send checks to the bulk verification endpoint.
+
+        Returns:
+            List of verification result dicts, in the same order as checks
+        """
+        body = {"checks": self._build_verification_payloads(checks)}
+        return self._post_verification_batch("bulk", body, "results", len(checks))
+
+    def _post_verification_batch(
+        self,
+        endpoint: str,
+        body: Dict[str, Any],
+        results_key: str,
+        count: int
+    ) -> List[Dict]:
+        """
+        POST a batch of signed verification requests and map each item in the response.
+
+        Args:
+            endpoint: Path under /api/v1/sdk-api/verifications/ ("bulk" or "scenario")
+            body: Request body
+            results_key: Response key holding the per-request items
+            count: Number of verification requests in the body
+
+        Returns:
+            List of verification result dicts, in request order
+        """
+        def _pending(error_msg: str) -> List[Dict]:
+            return [_pending_result(error_msg) for _ in range(count)]
+
+        url = f"{self.aim_url}/api/v1/sdk-api/verifications/{endpoint}"
+
+        # Prepare headers - NO AUTH TOKENS, each request carries its own Ed25519 signature
+        headers = {
+            'Content-Type': 'application/json',
+            'User-Agent': f'AIM-Python-SDK/1.0.0'
+        }
+
+        # Add SDK token header if available (for usage tracking only, not auth)
+        if self.sdk_token_id:
+            headers['X-SDK-Token'] = self.sdk_token_id
+
+        try:
+            response = self._send_request(
+                method="POST",
+                url=url,
+                data=json_dumps(body),
+                headers=headers
+            )
+
+            if response.status_code >= 400:
+                error_msg = _http_error_message(response.status_code, response.text)
+                print(f" Warning: {endpoint.capitalize()} verification request failed: {error_msg}")
+                print(f"   Returning default 'pending' status.")
+                return _pending(error_msg)
+
+            items = response.json().get(results_key, [])
 
-        except (AuthenticationError, ActionDeniedError):
-            raise
         except requests.exceptions.RequestException as e:
-            # Handle network errors (connection refused, timeout, etc.)
-            print(f" Warning: Network error during verification: {type(e).__name__}: {str(e)}")
-            print(f"   Returning default 'pending' status. Action will be treated as requiring approval.")
-            return {
-                "verified": False,
-                "verification_id": None,
-                "status": "pending",
-                "error": f"Network error: {type(e).__name__}: {str(e)}"
-            }
+            print(f" Warning: Network error during {endpoint} verification: {type(e).__name__}: {str(e)}")
+            print(f"   Returning default 'pending' status. Actions will be treated as requiring approval.")
+            return _pending(f"Network error: {type(e).__name__}: {str(e)}")
         except json.JSONDecodeError as e:
-            # Handle JSON parsing errors
             print(f"  Warning: Invalid JSON response from server: {str(e)}")
             print(f"   Returning default 'pending' status.")
-            return {
-                "verified": False,
-                "verification_id": None,
-                "status": "pending",
-                "error": f"JSON decode error: {str(e)}"
-            }
-        except Exception as e:
-            # Catch all other exceptions
-            print(f"  Warning: Unexpected error during verification: {type(e).__name__}: {str(e)}")
-            print(f"   Returning default 'pending' status.")
-            return {
-                "verified": False,
-                "verification_id": None,
-                "status": "pending",
-                "error": f"Unexpected error: {type(e).__name__}: {str(e)}"
-            }
+            return _pending(f"JSON decode error: {str(e)}")
+
+        results = []
+        for item in items:
+            status = item.get("status")
+
+            if status == "approved":
+                result = {
+                    "verified": True,
+                    "verification_id": item.get("id"),
+                    "status": "approved",
+                    "approved_by": item.get("approved_by"),
+                    "expires_at": item.get("expires_at")
+                }
+            elif status == "denied":
+                result = {
+                    "verified": False,
+                    "verification_id": item.get("id"),
+                    "status": "denied",
+                    "reason": item.get("denial_reason", "Action denied by policy")
+                }
+            elif item.get("error"):
+                result = {
+                    "verified": False,
+                    "verification_id": None,
+                    "status": "pending",
+                    "error": item["error"]
+                }
+            else:
+                result = {
+                    "verified": False,
+                    "verification_id": item.get("id"),
+                    "status": "pending"
+                }
+
+            if "recorded" in item:
+                result["recorded"] = item["recorded"]
+            results.append(result)
+
+        if len(results) != count:
+            return _pending(f"Expected {count} results, got {len(results)}")
+
+        return results
 
     def _wait_for_approval(self, verification_id: str, timeout_seconds: int) -> Dict:
         """
@@ -527,56 +1048,15 @@ class AIMClient:
                 if self.sdk_token_id:
                     headers['X-SDK-Token'] = self.sdk_token_id
                 
-                response = self.session.request(
+                response = self._send_request(
                     method="GET",
                     url=url,
-                    headers=headers,
-                    timeout=self.timeout
+                    headers=headers
                 )
                 
-                # Handle authentication errors
-                if response.status_code == 401:
-                    raise AuthenticationError("Authentication failed - invalid agent credentials")
-
-                # Handle forbidden errors
-                if response.status_code == 403:
-                    raise AuthenticationError("Forbidden - insufficient permissions")
-
-                # Handle 404 - endpoint not found
-                if response.status_code == 404:
-                    print(f" Warning: Verification endpoint not found (404). Cannot poll for approval.")
-                    raise VerificationError("Verification endpoint not available - cannot complete approval process")
-
-                # Handle other HTTP errors
-                if response.status_code >= 400:
-                    error_msg = f"HTTP {response.status_code} error"
-                    try:
-                        error_detail = response.json().get("error", response.text)
-                        error_msg = f"{error_msg}: {error_detail}"
-                    except:
-                        error_msg = f"{error_msg}: {response.text[:200]}"
-                    # Continue polling on transient errors, but log the issue
-                    print(f" Warning: Error polling verification status: {error_msg}")
-                    time.sleep(poll_interval)
-                    poll_interval = min(poll_interval * 1.5, 10)
-                    continue
-
-                response.raise_for_status()
-                result = response.json()
-
-                status = result.get("status")
-
-                if status == "approved":
-                    return {
-                        "verified": True,
-                        "verification_id": verification_id,
-                        "approved_by": result.get("approved_by"),
-                        "expires_at": result.get("expires_at")
-                    }
-
-                if status == "denied":
-                    reason = result.get("denial_reason", "Action denied")
-                    raise ActionDeniedError(f"Action denied: {reason}")
+                result = self._approval_poll_result(verification_id, response.status_code, response.text)
+                if result is not None:
+                    return result
 
                 # Still pending, wait and retry
                 time.sleep(poll_interval)
@@ -620,6 +1100,10 @@ class AIMClient:
             result_summary: Brief summary of the result
             error_message: Error message if action failed
         """
+        # Cached approvals have no verification of their own to attach a result to
+        if not verification_id:
+            return
+
         try:
             # Use direct HTTP call to avoid signature issues
             url = f"{self.aim_url}/api/v1/sdk-api/verifications/{verification_id}/result"
@@ -644,17 +1128,16 @@ class AIMClient:
             if self.sdk_token_id:
                 headers['X-SDK-Token'] = self.sdk_token_id
             
-            response = self.session.request(
+            response = self._send_request(
                 method="POST",
                 url=url,
-                json={
+                data=json_dumps({
                     "result": "success" if success else "failure",
                     "result_summary": result_summary,
                     "error_message": error_message,
                     "timestamp": datetime.now(timezone.utc).isoformat()
-                },
-                headers=headers,
-                timeout=self.timeout
+                }),
+                headers=headers
             )
             
             # Don't raise on errors for logging - just continue
@@ -1459,17 +1942,18 @@ class AIMClient:
             - "critical": Destructive operations (requires approval)
         """
         def decorator(func: Callable) -> Callable:
+            # Everything that doesn't depend on call arguments is built once here
+            action = action_name or func.__name__
+            base_context = {
+                "risk_level": risk_level,
+                "function_name": func.__name__,
+                "module": func.__module__
+            }
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                # Use function name if action_name not provided
-                action = action_name or func.__name__
-
                 # Build context with risk level
-                context = {
-                    "risk_level": risk_level,
-                    "function_name": func.__name__,
-                    "module": func.__module__
-                }
+                context = base_context.copy()
 
                 # Add args/kwargs to context (for audit trail)
                 if args:
@@ -1778,6 +2262,7 @@ def _save_credentials(agent_name: str, credentials: Dict[str, Any]):
         "aim_url": credentials["aim_url"],
         "status": credentials.get("status", "unknown"),
         "trust_score": credentials.get("trust_score"),
+        "capabilities": credentials.get("capabilities"),
         "registered_at": datetime.now(timezone.utc).isoformat()
     }
 
@@ -1824,7 +2309,8 @@ def register_agent(
     capabilities: Optional[list] = None,
     auto_detect: bool = True,
     force_new: bool = False,
-    sdk_token_id: Optional[str] = None
+    sdk_token_id: Optional[str] = None,
+    local_capability_check: Optional[bool] = None
 ) -> AIMClient:
     """
     ONE-LINE agent registration with AIM - Radical simplicity meets enterprise security
@@ -1856,6 +2342,10 @@ def register_agent(
         auto_detect: Auto-detect capabilities and MCPs (default: True)
         force_new: Force new registration even if credentials exist
         sdk_token_id: SDK token for usage tracking (auto-loaded if available)
+        local_capability_check: Deny actions outside the granted capability namespaces
+            without contacting AIM (defaults to AIM_LOCAL_CAPABILITY_CHECK=1). Granted
+            capabilities are loaded once here; call invalidate_verify_cache() after
+            they change. Locally denied actions are not audited by the backend.
 
     Returns:
         AIMClient instance ready to use
@@ -1901,7 +2391,7 @@ def register_agent(
                 token_manager.credentials = existing_creds
                 token_manager.access_token = existing_creds.get("access_token")
 
-            return AIMClient(
+            client = AIMClient(
                 agent_id=existing_creds["agent_id"],
                 public_key=existing_creds["public_key"],
                 private_key=existing_creds["private_key"],
@@ -1909,6 +2399,10 @@ def register_agent(
                 api_key=api_key,  # Pass API key for verification requests
                 oauth_token_manager=token_manager
             )
+            client.set_declared_capabilities(existing_creds.get("capabilities") or capabilities)
+            _configure_capability_check(client, local_capability_check)
+            _configure_verify_cache(client)
+            return client
 
     # 2. Detect authentication mode (SDK vs Manual)
     sdk_creds = load_sdk_credentials()
@@ -1998,7 +2492,7 @@ def register_agent(
     try:
         if auth_mode == "oauth":
             # OAuth Mode: Use authenticated endpoint with OAuth token
-            return _register_via_oauth(
+            client = _register_via_oauth(
                 name=name,
                 aim_url=aim_url,
                 sdk_creds=sdk_creds,
@@ -2008,7 +2502,7 @@ def register_agent(
             )
         else:
             # API Key Mode: Use public endpoint with API key header
-            return _register_via_api_key(
+            client = _register_via_api_key(
                 name=name,
                 aim_url=aim_url,
                 api_key=api_key,
@@ -2022,6 +2516,39 @@ def register_agent(
     except Exception as e:
         raise ConfigurationError(f"Registration failed: {e}")
 
+    if client.declared_capabilities is None:
+        client.set_declared_capabilities(capabilities)
+    _configure_capability_check(client, local_capability_check)
+    _configure_verify_cache(client)
+    return client
+
+
+def _configure_capability_check(client: AIMClient, local_capability_check: Optional[bool]):
+    """Enable the local capability pre-check from the argument or AIM_LOCAL_CAPABILITY_CHECK"""
+    if local_capability_check is None:
+        local_capability_check = os.getenv("AIM_LOCAL_CAPABILITY_CHECK") == "1"
+    client.local_capability_check = local_capability_check
+    if local_capability_check:
+        # AIM enforces granted capabilities, which may differ from the declared ones
+        client.refresh_capabilities()
+
+
+def _configure_verify_cache(client: AIMClient):
+    """Enable verification caching from AIM_VERIFY_CACHE_TTL (seconds)"""
+    value = os.getenv("AIM_VERIFY_CACHE_TTL", "0") or "0"
+    try:
+        ttl = float(value)
+    except ValueError:
+        # A typo in an optional setting must not fail an otherwise good registration
+        import logging
+        logging.getLogger(__name__).warning(
+            f"Ignoring AIM_VERIFY_CACHE_TTL={value!r}: expected seconds as a number; "
+            "verification caching is disabled"
+        )
+        return
+    if ttl > 0:
+        client.enable_verify_cache(ttl)
+
 
 def _register_via_oauth(
     name: str,
@@ -2067,11 +2594,18 @@ def _register_via_oauth(
     if sdk_token_id:
         headers["X-SDK-Token"] = sdk_token_id
 
-    response = requests.post(
-        url,
-        json=registration_data,
-        headers=headers,
-        timeout=30
+    # Same pooled session is handed to the client, so its first call reuses this connection
+    session = _new_http_session()
+    deadline = time.monotonic() + REGISTRATION_TIMEOUT
+    response = call_with_retry(
+        lambda: session.post(
+            url, json=registration_data, headers=headers,
+            timeout=max(deadline - time.monotonic(), 0.001)
+        ),
+        RETRYABLE_ERRORS,
+        attempts=3,
+        deadline=deadline,
+        retry_if=_connect_failed  # Never re-send once the request may have arrived: the agent may exist
     )
 
     if response.status_code not in [200, 201]:
@@ -2114,8 +2648,10 @@ def _register_via_oauth(
         public_key=credentials["public_key"],
         private_key=credentials["private_key"],
         aim_url=credentials["aim_url"],
-        oauth_token_manager=token_manager  # Pass token manager for OAuth authentication
+        oauth_token_manager=token_manager,  # Pass token manager for OAuth authentication
+        session=session
     )
+    client.set_declared_capabilities(credentials.get("capabilities"))
 
     if talks_to:
         from .detection import auto_detect_mcps
@@ -2151,11 +2687,18 @@ def _register_via_api_key(
     if sdk_token_id:
         headers["X-SDK-Token"] = sdk_token_id
 
-    response = requests.post(
-        url,
-        json=registration_data,
-        headers=headers,
-        timeout=30
+    # Same pooled session is handed to the client, so its first call reuses this connection
+    session = _new_http_session()
+    deadline = time.monotonic() + REGISTRATION_TIMEOUT
+    response = call_with_retry(
+        lambda: session.post(
+            url, json=registration_data, headers=headers,
+            timeout=max(deadline - time.monotonic(), 0.001)
+        ),
+        RETRYABLE_ERRORS,
+        attempts=3,
+        deadline=deadline,
+        retry_if=_connect_failed  # Never re-send once the request may have arrived: the agent may exist
     )
 
     if response.status_code != 201:
@@ -2172,8 +2715,10 @@ def _register_via_api_key(
         agent_id=credentials["agent_id"],
         public_key=credentials["public_key"],
         private_key=credentials["private_key"],
-        aim_url=credentials["aim_url"]
+        aim_url=credentials["aim_url"],
+        session=session
     )
+    client.set_declared_capabilities(credentials.get("capabilities"))
 
     if talks_to:
         from .detection import auto_detect_mcps
@@ -0,0 +1,95 @@
+"""
+Retry helpers for transient network failures
+
+Bounded exponential backoff with jitter: a dropped connection costs tens of
+milliseconds instead of a failed action or a full socket timeout, and
+concurrent clients don't retry in lockstep.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Backoff for connection errors and timeouts: 50 ms doubling up to 500 ms
+RETRY_BASE_DELAY = 0.05
+RETRY_MAX_DELAY = 0.5
+
+
+def backoff_delay(attempt: int, base: float = RETRY_BASE_DELAY, cap: float = RETRY_MAX_DELAY) -> float:
+    """
+    Delay before retry number attempt (0-based).
+
+    Exponential growth capped at cap, with "equal jitter": half the delay is
+    fixed and half is random.
+    """
+    delay = min(cap, base * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _log_retry(error: Exception, delay: float, attempt: int, attempts: int):
+    logger.warning(
+        "Transient network error (%s), retrying in %.0f ms (%d/%d)",
+        type(error).__name__, delay * 1000, attempt + 1, attempts - 1
+    )
+
+
+def _retry_delay(attempt: int, attempts: int, deadline: Optional[float]) -> Optional[float]:
+    """Backoff before the next attempt, or None if attempts or the deadline are used up."""
+    if attempt + 1 >= attempts:
+        return None
+    delay = backoff_delay(attempt)
+    if deadline is not None and time.monotonic() + delay >= deadline:
+        return None
+    return delay
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    retry_on: Tuple[Type[BaseException], ...],
+    attempts: int,
+    deadline: Optional[float] = None,
+    retry_if: Optional[Callable[[BaseException], bool]] = None
+) -> T:
+    """
+    Call func, retrying on retry_on exceptions up to attempts times in total.
+
+    retry_if narrows retry_on further: errors it returns False for are
+    re-raised immediately. No retry is started past deadline (a
+    time.monotonic() value). The last exception is re-raised once attempts
+    or time run out.
+    """
+    for attempt in range(attempts):
+        try:
+            return func()
+        except retry_on as e:
+            if retry_if is not None and not retry_if(e):
+                raise
+            delay = _retry_delay(attempt, attempts, deadline)
+            if delay is None:
+                raise
+            _log_retry(e, delay, attempt, attempts)
+            time.sleep(delay)
+
+
+async def async_call_with_retry(
+    func: Callable[[], Awaitable[T]],
+    retry_on: Tuple[Type[BaseException], ...],
+    attempts: int,
+    deadline: Optional[float] = None
+) -> T:
+    """Like call_with_retry(), but awaits func and backs off with asyncio.sleep."""
+    for attempt in range(attempts):
+        try:
+            return await func()
+        except retry_on as e:
+            delay = _retry_delay(attempt, attempts, deadline)
+            if delay is None:
+                raise
+            _log_retry(e, delay, attempt, attempts)
+            await asyncio.sleep(delay)
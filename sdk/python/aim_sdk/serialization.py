@@ -0,0 +1,42 @@
+"""
+JSON encoding for request bodies
+
+Uses orjson when installed (pip install aim-sdk[fast]); otherwise falls back
+to the standard library json module with compact separators. Both produce
+compact UTF-8 bytes, and datetimes are encoded as ISO 8601 strings.
+
+Signed request bodies keep using json.dumps(sort_keys=True) in AIMClient,
+since the backend verifies the signature against that exact format.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> str:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize obj to compact UTF-8 encoded JSON.
+
+    Non-string dict keys are stringified like json.dumps does. Anything else
+    orjson rejects (e.g. integers wider than 64 bits) is retried with the
+    standard library encoder.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(',', ':'), default=_default).encode('utf-8')
@@ -11,15 +11,27 @@ SETUP (30 seconds):
   3. Run: python demo_agent.py
 
 Then open your AIM dashboard and watch the magic happen!
+
+Set AIM_LOCAL_CAPABILITY_CHECK=1 to block ungranted capabilities in the SDK
+without a round-trip to AIM. AIM_VERIFY_CACHE_TTL=60 reuses approvals for
+repeated actions (e.g. the random bulk run) instead of re-verifying each one.
+
+Run with --fast (or AIM_DEMO_FAST=1) to skip the pacing delays, e.g. for
+benchmarks and CI.
 """
 
+import os
 import sys
 import time
 import random
-from datetime import datetime
+import asyncio
+import threading
+
+# Pacing delays only help humans follow along; --fast / AIM_DEMO_FAST=1 removes them
+SLEEP_SCALE = 0.0 if ("--fast" in sys.argv[1:] or os.getenv("AIM_DEMO_FAST")) else 1.0
 
-# Banner
-print("""
+# Static screens, rendered once at import
+_BANNER_TEXT = """
 ================================================================================
                      AIM DEMO AGENT - Interactive Demo
 ================================================================================
@@ -29,11 +41,81 @@ Watch your AIM dashboard update in real-time as you perform actions!
 Dashboard: http://localhost:3000/dashboard/agents
 
 ================================================================================
-""")
+
+"""
+
+_CBAC_INTRO_TEXT = """
+================================================================================
+         Capability-Based Access Control (CBAC) - Prompt Injection Defense
+================================================================================
+
+This demo shows how AIM's Capability-Based Access Control (CBAC) blocks
+prompt injection attacks. The agent only has these capabilities declared:
+  - api:call (for weather/search APIs)
+  - database:read (for user data)
+  - notification:send (for alerts)
+  - payment:process (for refunds)
+
+Watch what happens when an attacker tries to make the agent do something
+it's NOT authorized to do...
+================================================================================
+
+"""
+
+_CBAC_OUTRO_TEXT = """
+================================================================================
+              Capability-Based Access Control (CBAC) Demo Complete
+================================================================================
+
+All 4 prompt injection attacks were BLOCKED by AIM's capability enforcement.
+
+Key takeaway: Even if an attacker tricks your agent's LLM into wanting to
+perform an unauthorized action, AIM blocks it because the action isn't in
+the agent's declared capabilities.
+
+This is why Capability-Based Access Control matters - security at the API
+layer, not just the prompt layer.
+
+Check your dashboard to see the security alerts:
+  → http://localhost:3000/dashboard/alerts
+  → http://localhost:3000/dashboard/agents (click demo-agent → Violations)
+================================================================================
+
+"""
+
+_MENU_TEXT = """
+================================================================================
+                           CHOOSE AN ACTION
+================================================================================
+
+  LOW RISK (logged, minimal monitoring):
+    1. Check Weather        - Simulate checking weather for a city
+    2. Search Products      - Simulate searching for products
+
+  MEDIUM RISK (logged, monitored for patterns):
+    3. Get User Profile     - Simulate reading user data from database
+    4. Query Orders         - Simulate querying order history
+
+  HIGH RISK (logged, closely monitored, affects trust score):
+    5. Send Notification    - Simulate sending a notification
+    6. Process Refund       - Simulate processing a payment refund
+
+  SECURITY DEMO:
+    7. Run All Actions      - Run all actions in sequence (great for demo!)
+    8. Run 10 Random Actions- Bulk test with random actions
+    9. Capability-Based Access Control (CBAC) Demo - See attacks get BLOCKED!
+
+  0. Exit
+
+================================================================================
+
+"""
+
+sys.stdout.write(_BANNER_TEXT)
 
 # Try to import the SDK
 try:
-    from aim_sdk import secure
+    from aim_sdk import secure, AsyncAIMClient
 except ImportError:
     print("ERROR: Could not import aim_sdk")
     print()
@@ -69,9 +151,18 @@ except Exception as e:
     print("Try downloading a fresh SDK from: http://localhost:3000/dashboard/sdk")
     sys.exit(1)
 
+def emit(*lines: str):
+    """Write several lines to stdout in one call and flush once."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+# Async wrapper so bulk runs can verify actions concurrently
+async_agent = AsyncAIMClient(agent, max_concurrency=8)
+
 
 # Define demo actions with different risk levels
-@agent.track_action(risk_level="low")
+@async_agent.track_action(risk_level="low")
 def check_weather(city: str) -> dict:
     """Simulate checking weather - LOW risk action"""
     conditions = ["Sunny", "Cloudy", "Rainy", "Windy", "Snowy"]
@@ -83,7 +174,7 @@ def check_weather(city: str) -> dict:
     }
 
 
-@agent.track_action(risk_level="low")
+@async_agent.track_action(risk_level="low")
 def search_products(query: str) -> dict:
     """Simulate product search - LOW risk action"""
     return {
@@ -93,7 +184,7 @@ def search_products(query: str) -> dict:
     }
 
 
-@agent.track_action(risk_level="medium", resource="database:read")
+@async_agent.track_action(risk_level="medium", resource="database:read")
 def get_user_profile(user_id: str) -> dict:
     """Simulate reading user data - MEDIUM risk action"""
     return {
@@ -104,7 +195,7 @@ def get_user_profile(user_id: str) -> dict:
     }
 
 
-@agent.track_action(risk_level="medium", resource="database:read")
+@async_agent.track_action(risk_level="medium", resource="database:read")
 def query_orders(user_id: str) -> dict:
     """Simulate querying orders - MEDIUM risk action"""
     return {
@@ -114,18 +205,18 @@ def query_orders(user_id: str) -> dict:
     }
 
 
-@agent.track_action(risk_level="high", resource="notification:send")
+@async_agent.track_action(risk_level="high", resource="notification:send")
 def send_notification(user_id: str, message: str) -> dict:
     """Simulate sending notification - HIGH risk action"""
     return {
         "user_id": user_id,
         "message": message,
         "status": "sent",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": time.time_ns()  # Epoch nanoseconds; format for display only when needed
     }
 
 
-@agent.track_action(risk_level="high", resource="payment:process")
+@async_agent.track_action(risk_level="high", resource="payment:process")
 def process_refund(order_id: str, amount: float) -> dict:
     """Simulate processing refund - HIGH risk action"""
     return {
@@ -141,22 +232,7 @@ def run_cbac_demo():
     Demonstrate Capability-Based Access Control (CBAC) blocking prompt injection attacks.
     Shows how AIM prevents unauthorized actions even when an attacker tricks the LLM.
     """
-    print("""
-================================================================================
-         Capability-Based Access Control (CBAC) - Prompt Injection Defense
-================================================================================
-
-This demo shows how AIM's Capability-Based Access Control (CBAC) blocks
-prompt injection attacks. The agent only has these capabilities declared:
-  - api:call (for weather/search APIs)
-  - database:read (for user data)
-  - notification:send (for alerts)
-  - payment:process (for refunds)
-
-Watch what happens when an attacker tries to make the agent do something
-it's NOT authorized to do...
-================================================================================
-""")
+    sys.stdout.write(_CBAC_INTRO_TEXT)
 
     attacks = [
         {
@@ -185,195 +261,226 @@ it's NOT authorized to do...
         },
     ]
 
-    for i, attack in enumerate(attacks, 1):
-        print(f"\n--- Attack {i}/{len(attacks)}: {attack['name']} ---")
-        print(f"Attacker prompt: \"{attack['prompt']}\"")
-        print()
-        print("  [LLM] Attempting to comply with request...")
-        print(f"  [AIM] Intercepting action: {attack['action']}")
-        print(f"        Resource: {attack['resource']}")
-        print()
-
-        # Try to verify the unauthorized action
-        try:
-            result = agent.verify_action(
-                action_type=attack['action'],
-                resource=attack['resource'],
-                context={"source": "prompt_injection_demo", "prompt": attack['prompt'][:100]}
-            )
-            # Even if it returns, check if denied
-            if result.get("status") == "denied" or not result.get("verified", True):
-                print("  [AIM] ❌ ACTION BLOCKED!")
-                print(f"        Reason: '{attack['action']}' not in agent's declared capabilities")
-                print("        → Security alert created")
-                print("        → Violation logged for audit")
-            else:
-                print("  [AIM] Action result:", result.get("status", "unknown"))
-        except Exception as e:
-            print("  [AIM] ❌ ACTION BLOCKED!")
-            print(f"        Reason: '{attack['action']}' not in agent's declared capabilities")
-            print("        → Security alert created")
-            print("        → Violation logged for audit")
-
-        time.sleep(1)
-
-    print("""
-================================================================================
-              Capability-Based Access Control (CBAC) Demo Complete
-================================================================================
-
-All 4 prompt injection attacks were BLOCKED by AIM's capability enforcement.
-
-Key takeaway: Even if an attacker tricks your agent's LLM into wanting to
-perform an unauthorized action, AIM blocks it because the action isn't in
-the agent's declared capabilities.
+    # Verify all attacks in a single round-trip instead of one request per attack
+    try:
+        results = agent.verify_action_bulk([
+            {
+                "action_type": attack['action'],
+                "resource": attack['resource'],
+                "context": {"source": "prompt_injection_demo", "prompt": attack['prompt'][:100]}
+            }
+            for attack in attacks
+        ])
+    except Exception:
+        # Treat a failed request as a block, same as a denied verification
+        results = [{"status": "denied", "verified": False} for _ in attacks]
+
+    for i, (attack, result) in enumerate(zip(attacks, results), 1):
+        lines = [
+            f"\n--- Attack {i}/{len(attacks)}: {attack['name']} ---",
+            f"Attacker prompt: \"{attack['prompt']}\"",
+            "",
+            "  [LLM] Attempting to comply with request...",
+            f"  [AIM] Intercepting action: {attack['action']}",
+            f"        Resource: {attack['resource']}",
+            "",
+        ]
+
+        # Even if it returns, check if denied
+        if result.get("local"):
+            lines += [
+                "  [AIM] ❌ ACTION BLOCKED LOCALLY!",
+                f"        Reason: '{attack['action']}' not in agent's declared capabilities",
+                "        → Denied by the SDK before any network call",
+            ]
+        elif result.get("status") == "denied" or not result.get("verified", True):
+            lines += [
+                "  [AIM] ❌ ACTION BLOCKED!",
+                f"        Reason: '{attack['action']}' not in agent's declared capabilities",
+                "        → Security alert created",
+                "        → Violation logged for audit",
+            ]
+        else:
+            lines.append(f"  [AIM] Action result: {result.get('status', 'unknown')}")
+        emit(*lines)
 
-This is why Capability-Based Access Control matters - security at the API
-layer, not just the prompt layer.
+        time.sleep(1 * SLEEP_SCALE)  # Visual pacing only - verification already completed
 
-Check your dashboard to see the security alerts:
-  → http://localhost:3000/dashboard/alerts
-  → http://localhost:3000/dashboard/agents (click demo-agent → Violations)
-================================================================================
-""")
+    sys.stdout.write(_CBAC_OUTRO_TEXT)
 
 
-def print_menu():
-    """Print the action menu"""
-    print("""
-================================================================================
-                           CHOOSE AN ACTION
-================================================================================
+async def ainput(prompt: str) -> str:
+    """
+    input() on a worker thread, so the event loop keeps running while the user types.
 
-  LOW RISK (logged, minimal monitoring):
-    1. Check Weather        - Simulate checking weather for a city
-    2. Search Products      - Simulate searching for products
+    Uses a daemon thread rather than the default executor: asyncio.run() joins
+    executor threads on shutdown, which would hang on Ctrl+C until Enter is pressed.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
 
-  MEDIUM RISK (logged, monitored for patterns):
-    3. Get User Profile     - Simulate reading user data from database
-    4. Query Orders         - Simulate querying order history
+    def settle(method, value):
+        if not future.done():
+            method(value)
 
-  HIGH RISK (logged, closely monitored, affects trust score):
-    5. Send Notification    - Simulate sending a notification
-    6. Process Refund       - Simulate processing a payment refund
+    def read():
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(settle, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(settle, future.set_result, line)
 
-  SECURITY DEMO:
-    7. Run All Actions      - Run all actions in sequence (great for demo!)
-    8. Run 10 Random Actions- Bulk test with random actions
-    9. Capability-Based Access Control (CBAC) Demo - See attacks get BLOCKED!
+    threading.Thread(target=read, name="demo-input", daemon=True).start()
+    return await future
 
-  0. Exit
 
-================================================================================
-""")
+def print_menu():
+    """Print the action menu"""
+    sys.stdout.write(_MENU_TEXT)
 
 
-def run_action(choice: str):
+async def run_action(choice: str):
     """Execute the selected action"""
     try:
         if choice == "1":
-            city = input("Enter city name [San Francisco]: ").strip() or "San Francisco"
-            print(f"\nChecking weather for {city}...")
-            result = check_weather(city)
-            print(f"  Result: {result['temperature']}F, {result['condition']}")
+            city = (await ainput("Enter city name [San Francisco]: ")).strip() or "San Francisco"
+            result = await check_weather(city)
+            emit(f"\nChecking weather for {city}...",
+                 f"  Result: {result['temperature']}F, {result['condition']}")
 
         elif choice == "2":
-            query = input("Enter search query [laptop]: ").strip() or "laptop"
-            print(f"\nSearching for '{query}'...")
-            result = search_products(query)
-            print(f"  Found {result['results']} results. Top: {result['top_result']}")
+            query = (await ainput("Enter search query [laptop]: ")).strip() or "laptop"
+            result = await search_products(query)
+            emit(f"\nSearching for '{query}'...",
+                 f"  Found {result['results']} results. Top: {result['top_result']}")
 
         elif choice == "3":
-            user_id = input("Enter user ID [123]: ").strip() or "123"
-            print(f"\nGetting profile for user {user_id}...")
-            result = get_user_profile(user_id)
-            print(f"  User: {result['name']} ({result['email']})")
+            user_id = (await ainput("Enter user ID [123]: ")).strip() or "123"
+            result = await get_user_profile(user_id)
+            emit(f"\nGetting profile for user {user_id}...",
+                 f"  User: {result['name']} ({result['email']})")
 
         elif choice == "4":
-            user_id = input("Enter user ID [123]: ").strip() or "123"
-            print(f"\nQuerying orders for user {user_id}...")
-            result = query_orders(user_id)
-            print(f"  Orders: {result['total_orders']}, Total: {result['total_spent']}")
+            user_id = (await ainput("Enter user ID [123]: ")).strip() or "123"
+            result = await query_orders(user_id)
+            emit(f"\nQuerying orders for user {user_id}...",
+                 f"  Orders: {result['total_orders']}, Total: {result['total_spent']}")
 
         elif choice == "5":
-            user_id = input("Enter user ID [123]: ").strip() or "123"
-            message = input("Enter message [Hello!]: ").strip() or "Hello!"
-            print(f"\nSending notification to user {user_id}...")
-            result = send_notification(user_id, message)
-            print(f"  Status: {result['status']}")
+            user_id = (await ainput("Enter user ID [123]: ")).strip() or "123"
+            message = (await ainput("Enter message [Hello!]: ")).strip() or "Hello!"
+            result = await send_notification(user_id, message)
+            emit(f"\nSending notification to user {user_id}...",
+                 f"  Status: {result['status']}")
 
         elif choice == "6":
-            order_id = input("Enter order ID [ORD-001]: ").strip() or "ORD-001"
-            amount = input("Enter refund amount [50.00]: ").strip() or "50.00"
-            print(f"\nProcessing refund for order {order_id}...")
-            result = process_refund(order_id, float(amount))
-            print(f"  Refund ID: {result['refund_id']}, Status: {result['status']}")
+            order_id = (await ainput("Enter order ID [ORD-001]: ")).strip() or "ORD-001"
+            amount = (await ainput("Enter refund amount [50.00]: ")).strip() or "50.00"
+            result = await process_refund(order_id, float(amount))
+            emit(f"\nProcessing refund for order {order_id}...",
+                 f"  Refund ID: {result['refund_id']}, Status: {result['status']}")
 
         elif choice == "7":
-            print("\nRunning all actions in sequence...\n")
-            actions = [
-                ("Check Weather", lambda: check_weather("New York")),
-                ("Search Products", lambda: search_products("headphones")),
-                ("Get User Profile", lambda: get_user_profile("user_456")),
-                ("Query Orders", lambda: query_orders("user_456")),
-                ("Send Notification", lambda: send_notification("user_456", "Your order shipped!")),
-                ("Process Refund", lambda: process_refund("ORD-789", 29.99)),
+            # The whole showcase runs as one scenario call; AIM verifies and logs each step
+            scenario = [
+                ("Check Weather", "check_weather", "low", None, {"city": "New York"}),
+                ("Search Products", "search_products", "low", None, {"query": "headphones"}),
+                ("Get User Profile", "get_user_profile", "medium", "database:read", {"user_id": "user_456"}),
+                ("Query Orders", "query_orders", "medium", "database:read", {"user_id": "user_456"}),
+                ("Send Notification", "send_notification", "high", "notification:send",
+                 {"user_id": "user_456", "message": "Your order shipped!"}),
+                ("Process Refund", "process_refund", "high", "payment:process",
+                 {"order_id": "ORD-789", "amount": 29.99}),
+            ]
+            steps = [
+                {
+                    "action_type": action_type,
+                    "resource": resource,
+                    "context": {"risk_level": risk_level, "kwargs": str(kwargs), "source": "demo_scenario"}
+                }
+                for _, action_type, risk_level, resource, kwargs in scenario
             ]
-            for name, action in actions:
-                print(f"  Running: {name}...")
-                action()
-                time.sleep(0.5)  # Small delay so dashboard updates are visible
-            print("\n  All actions completed!")
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, lambda: agent.run_scenario(steps)
+            )
+            emit("\nRunning all actions in sequence...\n",
+                 *(f"  Running: {name}... {result.get('status', 'unknown')}"
+                   for (name, *_), result in zip(scenario, results)),
+                 "\n  All actions completed!")
 
         elif choice == "8":
-            print("\nRunning 10 random actions...\n")
+            count = 10
+
+            # Draw every random input for the run up front, one batch per field
+            kinds = random.choices(range(6), k=count)
+            cities = random.choices(["NYC", "LA", "Chicago", "Miami", "Seattle"], k=count)
+            queries = random.choices(["phone", "shoes", "camera", "book", "watch"], k=count)
+            user_ids = random.choices(range(100, 1000), k=count)
+            order_ids = random.choices(range(1000, 10000), k=count)
+            amounts = [random.uniform(10, 100) for _ in range(count)]
+
             all_actions = [
-                lambda: check_weather(random.choice(["NYC", "LA", "Chicago", "Miami", "Seattle"])),
-                lambda: search_products(random.choice(["phone", "shoes", "camera", "book", "watch"])),
-                lambda: get_user_profile(f"user_{random.randint(100, 999)}"),
-                lambda: query_orders(f"user_{random.randint(100, 999)}"),
-                lambda: send_notification(f"user_{random.randint(100, 999)}", "Test notification"),
-                lambda: process_refund(f"ORD-{random.randint(1000, 9999)}", random.uniform(10, 100)),
+                ("check_weather", lambda i: check_weather(cities[i])),
+                ("search_products", lambda i: search_products(queries[i])),
+                ("get_user_profile", lambda i: get_user_profile(f"user_{user_ids[i]}")),
+                ("query_orders", lambda i: query_orders(f"user_{user_ids[i]}")),
+                ("send_notification", lambda i: send_notification(f"user_{user_ids[i]}", "Test notification")),
+                ("process_refund", lambda i: process_refund(f"ORD-{order_ids[i]}", amounts[i])),
             ]
-            for i in range(10):
-                action = random.choice(all_actions)
-                print(f"  Action {i+1}/10...", end=" ")
-                action()
-                print("Done")
-                time.sleep(0.3)
-            print("\n  All 10 actions completed!")
+
+            results = await asyncio.gather(*(all_actions[kinds[i]][1](i) for i in range(count)))
+
+            # Progress lines are written in action order once the whole batch is done;
+            # denied or unverified actions come back as error dicts, not exceptions
+            progress = [
+                f"  Action {i + 1}/{count} ({all_actions[kinds[i]][0]})... "
+                + (result.get("status", "failed") if isinstance(result, dict) and result.get("error") else "Done")
+                for i, result in enumerate(results)
+            ]
+            emit(f"\nRunning {count} random actions...\n", *progress,
+                 f"\n  All {count} actions completed!")
 
         elif choice == "9":
-            run_cbac_demo()
+            # Blocking verification + pacing sleeps, kept off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, run_cbac_demo)
 
         else:
             print("Invalid choice. Please try again.")
             return
 
-        print("\n  Check your AIM dashboard to see this action logged!")
-        print(f"  Dashboard: http://localhost:3000/dashboard/agents")
+        emit("\n  Check your AIM dashboard to see this action logged!",
+             "  Dashboard: http://localhost:3000/dashboard/agents")
 
     except Exception as e:
-        print(f"\n  ERROR: {e}")
-        print("  Make sure AIM backend is running (docker compose up -d)")
+        emit(f"\n  ERROR: {e}",
+             "  Make sure AIM backend is running (docker compose up -d)")
 
 
-def main():
+async def main_async():
     """Main loop"""
     print("READY! Open your AIM dashboard to watch actions in real-time.")
     print(f"Dashboard URL: http://localhost:3000/dashboard/agents")
 
-    while True:
-        print_menu()
-        choice = input("Enter your choice (0-9): ").strip()
+    try:
+        while True:
+            print_menu()
+            choice = (await ainput("Enter your choice (0-9): ")).strip()
+
+            if choice == "0":
+                print("\nThanks for trying AIM! Check your dashboard for the full activity log.")
+                print("Dashboard: http://localhost:3000/dashboard/agents")
+                break
 
-        if choice == "0":
-            print("\nThanks for trying AIM! Check your dashboard for the full activity log.")
-            print("Dashboard: http://localhost:3000/dashboard/agents")
-            break
+            await run_action(choice)
+            print()
+    finally:
+        await async_agent.close()
 
-        run_action(choice)
-        print()
+
+def main():
+    """Entry point"""
+    asyncio.run(main_async())
 
 
 if __name__ == "__main__":
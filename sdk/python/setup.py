@@ -38,6 +38,12 @@ setup(
         "keyring>=24.0.0",  # REQUIRED: System keyring for encryption keys
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",  # AsyncAIMClient (falls back to a thread pool without it)
+        ],
+        "fast": [
+            "orjson>=3.8.0",  # Faster JSON encoding for request bodies
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
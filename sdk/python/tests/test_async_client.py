@@ -0,0 +1,280 @@
+"""
+Tests for AsyncAIMClient
+"""
+
+import asyncio
+import base64
+import threading
+import time
+import pytest
+import responses
+from unittest.mock import patch
+from nacl.signing import SigningKey
+from nacl.encoding import Base64Encoder
+
+from aim_sdk import AIMClient, AsyncAIMClient
+from aim_sdk.async_client import AIOHTTP_AVAILABLE
+
+if AIOHTTP_AVAILABLE:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+
+@pytest.fixture
+def aim_client():
+    """Create AIMClient instance for testing"""
+    signing_key = SigningKey.generate()
+    return AIMClient(
+        agent_id="550e8400-e29b-41d4-a716-446655440000",
+        public_key=signing_key.verify_key.encode(encoder=Base64Encoder).decode('utf-8'),
+        private_key=base64.b64encode(bytes(signing_key)).decode('utf-8'),
+        aim_url="https://aim.example.com",
+        timeout=10,
+        auto_retry=False
+    )
+
+
+class TestAsyncTrackAction:
+    """Test @AsyncAIMClient.track_action decorator"""
+
+    def test_decorator_returns_coroutine_function(self, aim_client):
+        """Test decorated functions must be awaited and return the function result"""
+        async_client = AsyncAIMClient(aim_client)
+
+        @async_client.track_action(risk_level="low")
+        def get_weather(city):
+            return {"city": city}
+
+        approved = {"verified": True, "verification_id": "verification-123"}
+        with patch.object(aim_client, "verify_action", return_value=approved), \
+                patch.object(aim_client, "log_action_result") as mock_log, \
+                patch("aim_sdk.async_client.AIOHTTP_AVAILABLE", False):
+            assert asyncio.iscoroutinefunction(get_weather)
+            result = asyncio.run(get_weather("NYC"))
+
+        assert result == {"city": "NYC"}
+        mock_log.assert_called_once()
+        assert mock_log.call_args.kwargs["success"] is True
+
+    def test_decorator_denied(self, aim_client):
+        """Test denied actions return an error result without running the function"""
+        async_client = AsyncAIMClient(aim_client)
+        calls = []
+
+        @async_client.track_action(risk_level="high")
+        def delete_user(user_id):
+            calls.append(user_id)
+
+        denied = {"verified": False, "verification_id": None, "reason": "Capability not declared"}
+        with patch.object(aim_client, "verify_action", return_value=denied), \
+                patch("aim_sdk.async_client.AIOHTTP_AVAILABLE", False):
+            result = asyncio.run(delete_user("123"))
+
+        assert calls == []
+        assert result["status"] == "denied"
+        assert "Capability not declared" in result["error_message"]
+
+    def test_gather_runs_concurrently_within_limit(self, aim_client):
+        """Test gathered actions overlap but never exceed max_concurrency"""
+        async_client = AsyncAIMClient(aim_client, max_concurrency=3)
+        in_flight = []
+        peak = []
+
+        def slow_verify(**kwargs):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            time.sleep(0.05)
+            in_flight.pop()
+            return {"verified": True, "verification_id": "verification-123"}
+
+        @async_client.track_action(risk_level="low")
+        def noop(i):
+            return i
+
+        async def run_all():
+            return await asyncio.gather(*(noop(i) for i in range(6)))
+
+        with patch.object(aim_client, "verify_action", side_effect=slow_verify), \
+                patch.object(aim_client, "log_action_result"), \
+                patch("aim_sdk.async_client.AIOHTTP_AVAILABLE", False):
+            results = asyncio.run(run_all())
+
+        assert results == list(range(6))
+        assert 1 < max(peak) <= 3
+
+
+class TestAsyncVerifyAction:
+    """Test AsyncAIMClient.verify_action without aiohttp"""
+
+    @responses.activate
+    def test_verify_action_falls_back_to_sync_client(self, aim_client):
+        """Test verification runs through the sync client when aiohttp is missing"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications",
+            json={
+                "id": "verification-123",
+                "status": "approved",
+                "approved_by": "system",
+                "expires_at": "2025-10-07T13:00:00Z"
+            },
+            status=201
+        )
+
+        async_client = AsyncAIMClient(aim_client)
+        with patch("aim_sdk.async_client.AIOHTTP_AVAILABLE", False):
+            result = asyncio.run(async_client.verify_action("read_database", resource="users_table"))
+
+        assert result["verified"] is True
+        assert result["verification_id"] == "verification-123"
+
+
+class TestAsyncSession:
+    """Test aiohttp session pooling"""
+
+    def test_session_reused_until_closed(self, aim_client):
+        """Test one pooled ClientSession serves every call and close releases it"""
+        pytest.importorskip("aiohttp")
+        async_client = AsyncAIMClient(aim_client)
+
+        async def run():
+            first = async_client._get_session()
+            assert async_client._get_session() is first
+            assert first.connector.limit == 32
+            await async_client.close()
+            return first
+
+        session = asyncio.run(run())
+
+        assert session.closed
+        assert async_client._session is None
+
+
+async def _serve(aim_client, routes):
+    """Start a local AIM stand-in and point the client at it"""
+    app = web.Application()
+    app.add_routes(routes)
+    server = TestServer(app)
+    await server.start_server()
+    aim_client.aim_url = str(server.make_url("")).rstrip("/")
+    return server
+
+
+@pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not installed")
+class TestAsyncVerifyActionAiohttp:
+    """Test AsyncAIMClient against a local aiohttp server"""
+
+    def test_approved(self, aim_client):
+        """Test signed verification requests are sent and approvals returned"""
+        received = []
+
+        async def create(request):
+            received.append(await request.json())
+            return web.json_response({"id": "verification-123", "status": "approved"}, status=201)
+
+        async def run():
+            server = await _serve(aim_client, [web.post("/api/v1/sdk-api/verifications", create)])
+            async with AsyncAIMClient(aim_client) as async_client:
+                result = await async_client.verify_action("read_database", resource="users_table")
+            await server.close()
+            return result
+
+        result = asyncio.run(run())
+
+        assert result["verified"] is True
+        assert result["verification_id"] == "verification-123"
+        assert received[0]["action_type"] == "read_database"
+        assert received[0]["signature"]
+
+    def test_pending_then_approved(self, aim_client):
+        """Test pending verifications are polled until approved"""
+        async def create(request):
+            return web.json_response({"id": "verification-123", "status": "pending"}, status=201)
+
+        async def poll(request):
+            return web.json_response({"id": "verification-123", "status": "approved", "approved_by": "admin"})
+
+        async def run():
+            server = await _serve(aim_client, [
+                web.post("/api/v1/sdk-api/verifications", create),
+                web.get("/api/v1/sdk-api/verifications/{id}", poll),
+            ])
+            async with AsyncAIMClient(aim_client) as async_client:
+                result = await async_client.verify_action("send_email")
+            await server.close()
+            return result
+
+        result = asyncio.run(run())
+
+        assert result["verified"] is True
+        assert result["approved_by"] == "admin"
+
+    def test_missing_endpoint_returns_pending(self, aim_client):
+        """Test a 404 maps to the same pending result as the sync client"""
+        async def run():
+            server = await _serve(aim_client, [])
+            async with AsyncAIMClient(aim_client) as async_client:
+                result = await async_client.verify_action("read_database")
+            await server.close()
+            return result
+
+        result = asyncio.run(run())
+
+        assert result["verified"] is False
+        assert result["status"] == "pending"
+        assert result["error"] == "Endpoint not found - server may not be available"
+
+    def test_client_reused_across_event_loops(self, aim_client):
+        """Test one client works from two asyncio.run() calls without close()"""
+        async def create(request):
+            return web.json_response({"id": "verification-123", "status": "approved"}, status=201)
+
+        def run_in_new_loop(async_client):
+            async def run():
+                server = await _serve(aim_client, [web.post("/api/v1/sdk-api/verifications", create)])
+                try:
+                    return await async_client.verify_action("read_database")
+                finally:
+                    await server.close()
+            return asyncio.run(run())
+
+        async_client = AsyncAIMClient(aim_client)
+        first = run_in_new_loop(async_client)
+        second = run_in_new_loop(async_client)
+        asyncio.run(async_client.close())
+
+        assert first["verified"] is True
+        assert second["verified"] is True
+
+    def test_track_action_runs_sync_function_in_executor(self, aim_client):
+        """Test blocking functions run off the event loop and their result is logged"""
+        logged = []
+        threads = []
+
+        async def create(request):
+            return web.json_response({"id": "verification-123", "status": "approved"}, status=201)
+
+        async def log_result(request):
+            logged.append(await request.json())
+            return web.json_response({"status": "logged"})
+
+        async def run():
+            server = await _serve(aim_client, [
+                web.post("/api/v1/sdk-api/verifications", create),
+                web.post("/api/v1/sdk-api/verifications/{id}/result", log_result),
+            ])
+            async with AsyncAIMClient(aim_client) as async_client:
+                @async_client.track_action(risk_level="low")
+                def get_weather(city):
+                    threads.append(threading.current_thread())
+                    return {"city": city}
+
+                result = await get_weather("NYC")
+            await server.close()
+            return result
+
+        result = asyncio.run(run())
+
+        assert result == {"city": "NYC"}
+        assert threads[0] is not threading.main_thread()
+        assert logged[0]["result"] == "success"
@@ -10,6 +10,7 @@ from nacl.signing import SigningKey
 from nacl.encoding import Base64Encoder
 
 from aim_sdk import AIMClient
+from aim_sdk.client import _configure_verify_cache
 from aim_sdk.exceptions import (
     ConfigurationError,
     AuthenticationError,
@@ -236,6 +237,346 @@ class TestVerifyAction:
             )
 
 
+class TestVerifyActionBulk:
+    """Test bulk action verification"""
+
+    @responses.activate
+    def test_verify_action_bulk_single_request(self, aim_client):
+        """Test all checks are sent in one request and results keep their order"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications/bulk",
+            json={
+                "results": [
+                    {"id": "verification-1", "status": "approved", "approved_by": "system", "status_code": 201},
+                    {"id": "verification-2", "status": "denied", "denial_reason": "Capability not declared", "status_code": 403},
+                ]
+            },
+            status=200
+        )
+
+        results = aim_client.verify_action_bulk([
+            {"action_type": "database:read", "resource": "users_table"},
+            {"action_type": "file:write", "resource": "debug.txt", "context": {"source": "test"}},
+        ])
+
+        assert len(responses.calls) == 1
+        request_body = json.loads(responses.calls[0].request.body)
+        assert [c["action_type"] for c in request_body["checks"]] == ["database:read", "file:write"]
+        assert all(c["signature"] and c["public_key"] for c in request_body["checks"])
+
+        assert results[0]["verified"] is True
+        assert results[0]["verification_id"] == "verification-1"
+        assert results[1]["verified"] is False
+        assert results[1]["status"] == "denied"
+        assert results[1]["reason"] == "Capability not declared"
+
+    @responses.activate
+    def test_verify_action_bulk_server_error(self, aim_client):
+        """Test a failed bulk request returns pending results for every check"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications/bulk",
+            json={"error": "Invalid request body"},
+            status=400
+        )
+
+        results = aim_client.verify_action_bulk([
+            {"action_type": "database:read"},
+            {"action_type": "file:write"},
+        ])
+
+        assert len(results) == 2
+        assert all(r["status"] == "pending" and r["verified"] is False for r in results)
+        assert "Invalid request body" in results[0]["error"]
+
+    def test_verify_action_bulk_empty(self, aim_client):
+        """Test an empty check list makes no request"""
+        assert aim_client.verify_action_bulk([]) == []
+
+
+class TestRunScenario:
+    """Test scripted scenarios sent in one request"""
+
+    @responses.activate
+    def test_run_scenario_single_request(self, aim_client):
+        """Test all steps are sent together and results are recorded"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications/scenario",
+            json={
+                "steps": [
+                    {"id": "verification-1", "status": "approved", "status_code": 201, "recorded": True},
+                    {"id": "verification-2", "status": "denied", "denial_reason": "Capability not declared",
+                     "status_code": 403, "recorded": False},
+                ]
+            },
+            status=200
+        )
+
+        results = aim_client.run_scenario([
+            {"action_type": "check_weather", "context": {"args": {"city": "New York"}}},
+            {"action_type": "file:write", "resource": "debug.txt"},
+        ])
+
+        assert len(responses.calls) == 1
+        request_body = json.loads(responses.calls[0].request.body)
+        assert "delay_ms" not in request_body
+        assert [s["action_type"] for s in request_body["steps"]] == ["check_weather", "file:write"]
+
+        assert results[0]["verified"] is True
+        assert results[0]["recorded"] is True
+        assert results[1]["status"] == "denied"
+        assert results[1]["recorded"] is False
+
+
+class TestLocalCapabilityCheck:
+    """Test local pre-check against declared capabilities"""
+
+    CAPABILITIES = ["api:call", "database:read", "notification:send", "payment:process"]
+
+    @responses.activate
+    def test_undeclared_namespace_denied_without_request(self, aim_client):
+        """Test actions outside declared namespaces never reach the network"""
+        aim_client.set_declared_capabilities(self.CAPABILITIES)
+        aim_client.local_capability_check = True
+
+        with pytest.raises(ActionDeniedError, match="capability not granted"):
+            aim_client.verify_action(action_type="file:write", resource="debug.txt")
+
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_perform_action_blocked_locally(self, aim_client):
+        """Test perform_action never runs an undeclared action"""
+        aim_client.set_declared_capabilities(["api:call"])
+        aim_client.local_capability_check = True
+        calls = []
+
+        @aim_client.perform_action("file:write", resource="debug.txt")
+        def write_file():
+            calls.append(1)
+
+        with pytest.raises(ActionDeniedError):
+            write_file()
+
+        assert calls == []
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_declared_namespace_sent_to_aim(self, aim_client):
+        """Test declared namespaces and wildcards are still decided by AIM"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications",
+            json={"id": "verification-123", "status": "approved"},
+            status=201
+        )
+        aim_client.set_declared_capabilities(self.CAPABILITIES + ["file:*"])
+        aim_client.local_capability_check = True
+
+        assert aim_client.verify_action(action_type="database:write")["verified"] is True
+        assert aim_client.verify_action(action_type="file:read")["verified"] is True
+        assert aim_client.verify_action(action_type="check_weather")["verified"] is True
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_disabled_by_default(self, aim_client):
+        """Test declared capabilities alone do not short-circuit verification"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications",
+            json={"id": "verification-123", "status": "approved"},
+            status=201
+        )
+        aim_client.set_declared_capabilities(self.CAPABILITIES)
+
+        aim_client.verify_action(action_type="file:write")
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_bulk_only_sends_declared_checks(self, aim_client):
+        """Test bulk verification merges local denials with AIM results in order"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications/bulk",
+            json={"results": [{"id": "verification-1", "status": "approved"}]},
+            status=200
+        )
+        aim_client.set_declared_capabilities(self.CAPABILITIES)
+        aim_client.local_capability_check = True
+
+        results = aim_client.verify_action_bulk([
+            {"action_type": "file:read"},
+            {"action_type": "database:read"},
+            {"action_type": "user:delete"},
+        ])
+
+        request_body = json.loads(responses.calls[0].request.body)
+        assert [c["action_type"] for c in request_body["checks"]] == ["database:read"]
+        assert [r["status"] for r in results] == ["denied", "approved", "denied"]
+        assert results[1]["verification_id"] == "verification-1"
+
+    @responses.activate
+    def test_refresh_uses_granted_capabilities(self, aim_client):
+        """Test a capability revoked in AIM is denied locally after invalidation"""
+        agent_url = "https://aim.example.com/api/v1/sdk-api/agents/550e8400-e29b-41d4-a716-446655440000"
+        responses.add(
+            responses.GET,
+            agent_url,
+            json={"agent": {"capabilities": [{"capabilityType": "api:call"}, {"capabilityType": "file:read"}]}},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            agent_url,
+            json={"agent": {"capabilities": [{"capabilityType": "api:call"}]}},
+            status=200
+        )
+        aim_client.set_declared_capabilities(self.CAPABILITIES)
+        aim_client.local_capability_check = True
+
+        aim_client.refresh_capabilities()
+        assert aim_client.declared_capabilities == frozenset(["api:call", "file:read"])
+
+        aim_client.invalidate_verify_cache()
+        with pytest.raises(ActionDeniedError):
+            aim_client.verify_action(action_type="file:read")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_refresh_failure_defers_to_aim(self, aim_client):
+        """Test a failed refresh drops the stale list instead of denying with it"""
+        responses.add(
+            responses.GET,
+            "https://aim.example.com/api/v1/sdk-api/agents/550e8400-e29b-41d4-a716-446655440000",
+            json={"error": "unavailable"},
+            status=503
+        )
+        aim_client.set_declared_capabilities(["api:call"])
+        aim_client.local_capability_check = True
+
+        aim_client.refresh_capabilities()
+
+        assert aim_client.declared_capabilities is None
+        assert aim_client._check_declared_capability("file:write") is None
+
+
+class TestVerifyCache:
+    """Test verification result caching"""
+
+    def test_malformed_env_ttl_disables_cache(self, aim_client, monkeypatch, caplog):
+        """Test a bad AIM_VERIFY_CACHE_TTL is reported instead of failing registration"""
+        monkeypatch.setenv("AIM_VERIFY_CACHE_TTL", "60s")
+
+        _configure_verify_cache(aim_client)
+
+        assert aim_client._verify_cache is None
+        assert "AIM_VERIFY_CACHE_TTL" in caplog.text
+
+    def test_env_ttl_enables_cache(self, aim_client, monkeypatch):
+        """Test a numeric AIM_VERIFY_CACHE_TTL turns the cache on"""
+        monkeypatch.setenv("AIM_VERIFY_CACHE_TTL", "30")
+
+        _configure_verify_cache(aim_client)
+
+        assert aim_client._verify_cache is not None
+
+    @responses.activate
+    def test_approval_reused_for_same_resource_namespace(self, aim_client):
+        """Test repeated verifications in a namespace hit the cache"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications",
+            json={"id": "verification-123", "status": "approved"},
+            status=201
+        )
+        aim_client.enable_verify_cache(ttl=60)
+
+        first = aim_client.verify_action(action_type="database:read", resource="user:123")
+        second = aim_client.verify_action(action_type="database:read", resource="user:456")
+
+        assert len(responses.calls) == 1
+        assert first["verification_id"] == "verification-123"
+        assert second["verified"] is True
+        assert second["cached"] is True
+        assert second["verification_id"] is None
+
+    @responses.activate
+    def test_urls_and_paths_not_collapsed(self, aim_client):
+        """Test resources with a scheme or path only match exactly"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications",
+            json={"id": "verification-123", "status": "approved"},
+            status=201
+        )
+        aim_client.enable_verify_cache(ttl=60)
+
+        aim_client.verify_action(action_type="api:call", resource="https://api.example.com/a")
+        aim_client.verify_action(action_type="api:call", resource="https://evil.example.com/b")
+        aim_client.verify_action(action_type="file:read", resource="/etc/hosts")
+        aim_client.verify_action(action_type="file:read", resource="/etc/shadow")
+
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_cached_hit_does_not_log_result(self, aim_client):
+        """Test results of cached actions are not posted to the original verification"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications",
+            json={"id": "verification-123", "status": "approved"},
+            status=201
+        )
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications/verification-123/result",
+            json={"status": "logged"},
+            status=200
+        )
+        aim_client.enable_verify_cache(ttl=60)
+
+        aim_client.perform_action("database:read", resource="user:123")(lambda: "ok")()
+        aim_client.perform_action("database:read", resource="user:456")(lambda: "ok")()
+
+        result_calls = [c for c in responses.calls if c.request.url.endswith("/result")]
+        assert len(result_calls) == 1
+
+    @responses.activate
+    def test_invalidate_forces_new_verification(self, aim_client):
+        """Test invalidate_verify_cache() sends the next verification to AIM"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications",
+            json={"id": "verification-123", "status": "approved"},
+            status=201
+        )
+        aim_client.enable_verify_cache(ttl=60)
+
+        aim_client.verify_action(action_type="database:read", resource="user:123")
+        aim_client.invalidate_verify_cache()
+        aim_client.verify_action(action_type="database:read", resource="user:123")
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_pending_results_not_cached(self, aim_client):
+        """Test only approvals are cached"""
+        responses.add(
+            responses.POST,
+            "https://aim.example.com/api/v1/sdk-api/verifications",
+            json={"error": "Internal server error"},
+            status=500
+        )
+        aim_client.enable_verify_cache(ttl=60)
+
+        aim_client.verify_action(action_type="database:read")
+        aim_client.verify_action(action_type="database:read")
+
+        assert len(responses.calls) == 2
+
+
 class TestLogActionResult:
     """Test action result logging"""
 
@@ -308,7 +649,7 @@ class TestPerformActionDecorator:
         # Mock verification approval
         responses.add(
             responses.POST,
-            "https://aim.example.com/api/v1/verifications",
+            "https://aim.example.com/api/v1/sdk-api/verifications",
             json={
                 "id": "verification-123",
                 "status": "approved",
@@ -321,7 +662,7 @@ class TestPerformActionDecorator:
         # Mock result logging
         responses.add(
             responses.POST,
-            "https://aim.example.com/api/v1/verifications/verification-123/result",
+            "https://aim.example.com/api/v1/sdk-api/verifications/verification-123/result",
             json={"status": "logged"},
             status=200
         )
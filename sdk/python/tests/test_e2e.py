@@ -103,7 +103,7 @@ def test_zero_config_registration():
                     mock_token_manager.return_value = mock_tm_instance
 
                     # Mock the HTTP POST request
-                    with patch('aim_sdk.client.requests.post') as mock_post:
+                    with patch('aim_sdk.client.requests.Session.post') as mock_post:
                         mock_response = MagicMock()
                         mock_response.status_code = 201
                         mock_response.json.return_value = mock_registration_response
@@ -163,7 +163,7 @@ def test_api_key_registration():
     with patch('aim_sdk.client.load_sdk_credentials', return_value=None):
         with patch('aim_sdk.client._load_credentials', return_value=None):  # No existing creds
             with patch('aim_sdk.client._save_credentials'):  # Don't save to disk
-                with patch('aim_sdk.client.requests.post') as mock_post:
+                with patch('aim_sdk.client.requests.Session.post') as mock_post:
                     mock_response = MagicMock()
                     mock_response.status_code = 201
                     mock_response.json.return_value = mock_registration_response
@@ -0,0 +1,215 @@
+"""
+Tests for retry with exponential backoff and jitter
+"""
+
+import asyncio
+import base64
+import socket
+import threading
+import time
+import pytest
+import requests
+import responses
+from unittest.mock import AsyncMock, patch
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from nacl.signing import SigningKey
+from nacl.encoding import Base64Encoder
+
+from aim_sdk import AIMClient, AsyncAIMClient
+from aim_sdk.async_client import AIOHTTP_AVAILABLE
+from aim_sdk.retry import backoff_delay, call_with_retry, async_call_with_retry
+
+
+class TestBackoffDelay:
+    """Test backoff delay growth and jitter bounds"""
+
+    def test_delay_grows_and_is_capped(self):
+        """Test each delay lies in [d/2, d] for d = min(cap, base * 2**attempt)"""
+        for attempt in range(8):
+            expected = min(0.5, 0.05 * (2 ** attempt))
+            for _ in range(20):
+                assert expected / 2 <= backoff_delay(attempt) <= expected
+
+
+class TestCallWithRetry:
+    """Test bounded retry helpers"""
+
+    def test_retries_then_succeeds(self):
+        """Test transient errors are retried until the call succeeds"""
+        outcomes = [ConnectionError("reset"), ConnectionError("reset"), "ok"]
+
+        def flaky():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch("aim_sdk.retry.time.sleep") as mock_sleep:
+            assert call_with_retry(flaky, (ConnectionError,), attempts=3) == "ok"
+
+        assert mock_sleep.call_count == 2
+
+    def test_raises_when_exhausted(self):
+        """Test the last error is raised after the final attempt"""
+        calls = []
+
+        def always_fails():
+            calls.append(1)
+            raise TimeoutError("slow")
+
+        with patch("aim_sdk.retry.time.sleep"), pytest.raises(TimeoutError):
+            call_with_retry(always_fails, (TimeoutError,), attempts=3)
+
+        assert len(calls) == 3
+
+    def test_other_errors_not_retried(self):
+        """Test exceptions outside retry_on propagate immediately"""
+        calls = []
+
+        def bad():
+            calls.append(1)
+            raise ValueError("bug")
+
+        with pytest.raises(ValueError):
+            call_with_retry(bad, (ConnectionError,), attempts=3)
+
+        assert len(calls) == 1
+
+    def test_no_retry_past_deadline(self):
+        """Test retries stop once the time budget is spent"""
+        calls = []
+
+        def always_fails():
+            calls.append(1)
+            raise ConnectionError("refused")
+
+        with patch("aim_sdk.retry.time.sleep"), pytest.raises(ConnectionError):
+            call_with_retry(always_fails, (ConnectionError,), attempts=5, deadline=time.monotonic())
+
+        assert len(calls) == 1
+
+    def test_async_retries_with_asyncio_sleep(self):
+        """Test the async helper backs off without blocking the loop"""
+        outcomes = [ConnectionError("reset"), "ok"]
+
+        async def flaky():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch("aim_sdk.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            assert asyncio.run(async_call_with_retry(flaky, (ConnectionError,), attempts=3)) == "ok"
+
+        mock_sleep.assert_awaited_once()
+
+
+@pytest.fixture
+def hangup_server():
+    """Local server that reads each request in full, then closes without responding"""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    listener.settimeout(0.1)
+    received = []
+    stop = threading.Event()
+
+    def serve():
+        while not stop.is_set():
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                continue
+            with conn:
+                data = b""
+                while b"\r\n\r\n" not in data:
+                    data += conn.recv(65536)
+                head, _, body = data.partition(b"\r\n\r\n")
+                length = next(
+                    (int(line.split(b":")[1]) for line in head.split(b"\r\n")
+                     if line.lower().startswith(b"content-length:")),
+                    0
+                )
+                while len(body) < length:
+                    body += conn.recv(65536)
+                received.append(head.split(b"\r\n")[0])
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{listener.getsockname()[1]}", received
+    stop.set()
+    thread.join()
+    listener.close()
+
+
+@pytest.fixture
+def retrying_client():
+    """AIMClient with retries enabled"""
+    signing_key = SigningKey.generate()
+    return AIMClient(
+        agent_id="550e8400-e29b-41d4-a716-446655440000",
+        public_key=signing_key.verify_key.encode(encoder=Base64Encoder).decode('utf-8'),
+        private_key=base64.b64encode(bytes(signing_key)).decode('utf-8'),
+        aim_url="https://aim.example.com",
+        auto_retry=True,
+        max_retries=2
+    )
+
+
+class TestClientRetry:
+    """Test AIMClient retries verification on transient failures"""
+
+    @responses.activate
+    def test_verify_action_retries_connection_refused(self, retrying_client):
+        """Test a request that never reached the server is retried instead of returning pending"""
+        client = retrying_client
+        url = "https://aim.example.com/api/v1/sdk-api/verifications"
+        refused = MaxRetryError(None, url, NewConnectionError(None, "Connection refused"))
+        responses.add(responses.POST, url, body=requests.exceptions.ConnectionError(refused))
+        responses.add(responses.POST, url, json={"id": "verification-123", "status": "approved"}, status=201)
+
+        with patch("aim_sdk.retry.time.sleep"):
+            result = client.verify_action("read_database", resource="users_table")
+
+        assert len(responses.calls) == 2
+        assert result["verified"] is True
+
+    @responses.activate
+    def test_verify_action_does_not_resend_after_read_timeout(self, retrying_client):
+        """Test a POST that may have reached the server is not sent twice"""
+        url = "https://aim.example.com/api/v1/sdk-api/verifications"
+        responses.add(responses.POST, url, body=requests.exceptions.ReadTimeout("slow"))
+        responses.add(responses.POST, url, json={"id": "verification-123", "status": "approved"}, status=201)
+
+        with patch("aim_sdk.retry.time.sleep"):
+            result = retrying_client.verify_action("read_database", resource="users_table")
+
+        assert len(responses.calls) == 1
+        assert result["status"] == "pending"
+
+    def test_verify_action_not_resent_after_disconnect(self, retrying_client, hangup_server):
+        """Test a POST the server received is not re-sent when the connection drops"""
+        url, received = hangup_server
+        retrying_client.aim_url = url
+        retrying_client.max_retries = 3
+
+        result = retrying_client.verify_action("read_database", resource="users_table")
+
+        assert received == [b"POST /api/v1/sdk-api/verifications HTTP/1.1"]
+        assert result["status"] == "pending"
+
+    @pytest.mark.skipif(not AIOHTTP_AVAILABLE, reason="aiohttp not installed")
+    def test_async_verify_action_not_resent_after_disconnect(self, retrying_client, hangup_server):
+        """Test the aiohttp path does not re-send a POST after ServerDisconnectedError"""
+        url, received = hangup_server
+        retrying_client.aim_url = url
+        retrying_client.max_retries = 3
+
+        async def run():
+            async with AsyncAIMClient(retrying_client) as async_client:
+                return await async_client.verify_action("read_database", resource="users_table")
+
+        result = asyncio.run(run())
+
+        assert received == [b"POST /api/v1/sdk-api/verifications HTTP/1.1"]
+        assert result["status"] == "pending"
@@ -0,0 +1,48 @@
+"""
+Tests for JSON serialization helpers
+"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from aim_sdk.serialization import dumps
+
+
+class TestDumps:
+    """Test compact JSON encoding with and without orjson"""
+
+    def test_fallback_matches_orjson_layout(self):
+        """Test both encoders emit the same compact bytes"""
+        event = {"action": "get_weather", "risk": "low", "resource": None, "ts": 1}
+
+        with patch("aim_sdk.serialization.ORJSON_AVAILABLE", False):
+            fallback = dumps(event)
+
+        assert fallback == b'{"action":"get_weather","risk":"low","resource":null,"ts":1}'
+        assert json.loads(dumps(event)) == event
+
+    def test_datetime_encoded_as_iso_string(self):
+        """Test datetimes serialize without a default hook at the call site"""
+        moment = datetime(2025, 10, 7, 13, 0, 0, tzinfo=timezone.utc)
+
+        with patch("aim_sdk.serialization.ORJSON_AVAILABLE", False):
+            assert json.loads(dumps({"at": moment}))["at"] == "2025-10-07T13:00:00+00:00"
+
+        assert json.loads(dumps({"at": moment}))["at"].startswith("2025-10-07T13:00:00")
+
+    def test_non_string_keys_stringified(self):
+        """Test integer dict keys encode the same way with either encoder"""
+        context = {"ids": {1: "a", 2: "b"}}
+
+        with patch("aim_sdk.serialization.ORJSON_AVAILABLE", False):
+            fallback = dumps(context)
+
+        assert fallback == b'{"ids":{"1":"a","2":"b"}}'
+        assert dumps(context) == fallback
+
+    def test_orjson_rejection_falls_back_to_json(self):
+        """Test values orjson cannot encode still serialize via the stdlib"""
+        payload = {"big": 2 ** 70}
+
+        assert json.loads(dumps(payload)) == payload